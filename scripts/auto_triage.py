@@ -9,7 +9,7 @@ Usage:
     export ANTHROPIC_API_KEY=...
     export SUPABASE_URL=...
     export SUPABASE_KEY=...
-    export GITHUB_TOKEN=...
+    export GITHUB_TOKEN=...   # optional if `gh auth login` has been run
 
     python scripts/auto_triage.py
     python scripts/auto_triage.py --limit 10
@@ -20,11 +20,31 @@ import os
 import sys
 import json
 import argparse
+import random
 import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+import requests
 from anthropic import Anthropic
 from supabase import create_client
 
+# Per-state issue updates run concurrently (Supabase reads + GitHub API calls)
+ISSUE_WORKERS = 4
+
+GITHUB_API = "https://api.github.com"
+GITHUB_TIMEOUT = (5, 30)
+
+# One pooled connection to the GitHub API, shared by the issue workers
+_SESSION = requests.Session()
+_SESSION.headers.update({"Accept": "application/vnd.github+json"})
+
+# Bills scored per Claude request (the system prompt is sent once per batch)
+SCORING_BATCH_SIZE = 10
+# Scoring batches in flight at once (API calls are latency-bound)
+SCORING_WORKERS = 4
+
 SCORING_PROMPT = """You are scoring state legislative bills for PolicyEngine modelability.
 
 PolicyEngine is a microsimulation model of tax/benefit policy. Bills that change
@@ -53,6 +73,23 @@ Key distinctions:
 Return ONLY valid JSON (no markdown, no prose):
 {"score": <int>, "reform_type": "parametric|structural|unknown", "reasoning": "<one sentence>"}"""
 
+BATCH_SCORING_PROMPT = SCORING_PROMPT + """
+
+When given several numbered bills, score each one independently and return ONLY
+a JSON array with one object per bill, in the same order:
+[{"id": <1-based position of the bill in this list>, "score": <int>, "reform_type": "parametric|structural|unknown", "reasoning": "<one sentence>"}]"""
+
+
+def _parse_json_response(text):
+    """Parse a Claude JSON reply, stripping markdown fences if present."""
+    text = text.strip()
+    if text.startswith("```"):
+        text = text.split("```")[1]
+        if text.startswith("json"):
+            text = text[4:]
+        text = text.strip()
+    return json.loads(text)
+
 
 def score_bill(client, bill):
     """Score a single bill using Claude."""
@@ -68,14 +105,69 @@ Score this bill."""
         system=SCORING_PROMPT,
         messages=[{"role": "user", "content": user_msg}],
     )
-    text = response.content[0].text.strip()
-    # Strip markdown fences if present
-    if text.startswith("```"):
-        text = text.split("```")[1]
-        if text.startswith("json"):
-            text = text[4:]
-        text = text.strip()
-    return json.loads(text)
+    return _parse_json_response(response.content[0].text)
+
+
+def score_bills_batch(client, bills):
+    """Score several bills in one Claude call.
+
+    Returns {bill_id: result} for every bill that came back with a complete
+    score; bills missing from the reply should be re-scored with score_bill.
+    """
+    entries = "\n\n".join(
+        f"""{n}. Bill: {b['state']} {b['bill_number']}
+Title: {b['title']}
+Description: {b.get('description', '') or b['title']}"""
+        for n, b in enumerate(bills, 1)
+    )
+    response = client.messages.create(
+        model="claude-sonnet-4-5",
+        max_tokens=150 * len(bills) + 100,
+        system=BATCH_SCORING_PROMPT,
+        messages=[{"role": "user", "content": f"{entries}\n\nScore these {len(bills)} bills."}],
+    )
+    results = _parse_json_response(response.content[0].text)
+
+    scored = {}
+    seen = set()
+    for result in results:
+        try:
+            position = int(result["id"])
+        except (KeyError, TypeError, ValueError):
+            continue
+        # Positions are 1-based; anything out of range or repeated can't be
+        # trusted to belong to the bill it points at
+        if not 1 <= position <= len(bills) or position in seen:
+            continue
+        seen.add(position)
+        if all(k in result for k in ("score", "reform_type", "reasoning")):
+            scored[bills[position - 1]["bill_id"]] = result
+    return scored
+
+
+def score_batch(client, batch):
+    """
+    Score a batch of bills, falling back to single-bill calls for anything
+    the batch reply missed. Returns ([(bill, result, error)] in batch order,
+    batch_error): batch_error is the batch call's exception, if it failed.
+    Runs on a worker thread, so it reports through the return value only.
+    """
+    batch_results = {}
+    batch_error = None
+    if len(batch) > 1:
+        try:
+            batch_results = score_bills_batch(client, batch)
+        except Exception as e:
+            batch_error = e
+
+    scores = []
+    for bill in batch:
+        try:
+            result = batch_results.get(bill["bill_id"]) or score_bill(client, bill)
+            scores.append((bill, result, None))
+        except Exception as e:
+            scores.append((bill, None, e))
+    return scores, batch_error
 
 
 def fetch_unscored_bills(supabase, limit=None):
@@ -105,8 +197,19 @@ def fetch_unscored_bills(supabase, limit=None):
     return bills
 
 
+def _with_backoff(fn, attempts=3, base=0.5):
+    """Call fn(), retrying failures with exponential backoff plus jitter."""
+    for attempt in range(attempts):
+        try:
+            return fn()
+        except Exception:
+            if attempt == attempts - 1:
+                raise
+            time.sleep(base * (2 ** attempt) + random.random() * base)
+
+
 def save_score(supabase, bill_id, score, reform_type, reasoning):
-    """Save score to Supabase."""
+    """Save score to Supabase (retried, so a transient error doesn't waste the score)."""
     update = {
         "confidence_score": score,
         "reform_type": reform_type,
@@ -114,7 +217,9 @@ def save_score(supabase, bill_id, score, reform_type, reasoning):
     }
     if score < 20:
         update["skipped_reason"] = "not_modelable"
-    supabase.table("processed_bills").update(update).eq("bill_id", bill_id).execute()
+    _with_backoff(
+        lambda: supabase.table("processed_bills").update(update).eq("bill_id", bill_id).execute()
+    )
 
 
 def build_issue_body(supabase, state):
@@ -138,17 +243,23 @@ def build_issue_body(supabase, state):
     bills = result.data
     today = datetime.now().strftime("%Y-%m-%d")
 
+    # One pass: checklist line per bill, plus score buckets for the tables
     checklist_lines = []
+    high, med, low = [], [], []
+    state_prefix = state.lower()
     for b in bills:
-        rid = f"{b['state'].lower()}-{b['bill_number'].lower().replace(' ', '')}"
-        is_enc = b["bill_id"] in encoded_ids or rid in encoded_rids
-        check = "x" if is_enc else " "
-        title_short = b["title"][:60]
-        checklist_lines.append(f"- [{check}] {b['bill_number']} — {title_short} (`/encode-bill {state} {b['bill_number']}`)")
-
-    high = [b for b in bills if b["confidence_score"] >= 80]
-    med = [b for b in bills if 50 <= b["confidence_score"] < 80]
-    low = [b for b in bills if 20 <= b["confidence_score"] < 50]
+        bill_number = b["bill_number"]
+        rid = f"{state_prefix}-{bill_number.lower().replace(' ', '')}"
+        check = "x" if b["bill_id"] in encoded_ids or rid in encoded_rids else " "
+        checklist_lines.append(f"- [{check}] {bill_number} — {b['title'][:60]} (`/encode-bill {state} {bill_number}`)")
+
+        score = b["confidence_score"]
+        if score >= 80:
+            high.append(b)
+        elif score >= 50:
+            med.append(b)
+        elif score >= 20:
+            low.append(b)
 
     def row(b):
         title_short = b["title"][:80]
@@ -188,34 +299,70 @@ Last updated: {today}
     return body, len(high), len(med), len(low)
 
 
-def upsert_issue(repo, state, body):
+@lru_cache(maxsize=None)
+def github_token():
+    """GH_TOKEN/GITHUB_TOKEN, falling back to the local gh login. None if unavailable."""
+    token = os.environ.get("GH_TOKEN") or os.environ.get("GITHUB_TOKEN")
+    if token:
+        return token
+    try:
+        result = subprocess.run(["gh", "auth", "token"], capture_output=True, text=True, check=True)
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        return None
+    return result.stdout.strip() or None
+
+
+def github_request(method, path, **kwargs):
+    """Make an authenticated GitHub REST API request and return the JSON reply."""
+    token = github_token()
+    response = _SESSION.request(
+        method, f"{GITHUB_API}{path}",
+        headers={"Authorization": f"Bearer {token}"},
+        timeout=GITHUB_TIMEOUT, **kwargs,
+    )
+    response.raise_for_status()
+    return response.json()
+
+
+def find_triage_issues(repo):
+    """Map title -> number for the repo's open bill-triage issues."""
+    issues = {}
+    page = 1
+    while True:
+        batch = github_request(
+            "GET", f"/repos/{repo}/issues",
+            params={"labels": "bill-triage", "state": "open", "per_page": 100, "page": page},
+        )
+        issues.update((i["title"], i["number"]) for i in batch if "pull_request" not in i)
+        if len(batch) < 100:
+            return issues
+        page += 1
+
+
+def upsert_issue(repo, state, body, existing):
     """Create or update the per-state triage issue."""
     title = f"[{state}] Bill Triage"
 
-    # Find existing issue
-    result = subprocess.run(
-        ["gh", "issue", "list", "--repo", repo, "--label", "bill-triage",
-         "--search", title, "--state", "open", "--json", "number,title", "--limit", "5"],
-        capture_output=True, text=True, check=True,
-    )
-    issues = json.loads(result.stdout)
-    match = next((i for i in issues if i["title"] == title), None)
-
-    if match:
-        subprocess.run(
-            ["gh", "issue", "edit", str(match["number"]), "--repo", repo, "--body-file", "-"],
-            input=body, text=True, check=True,
-        )
-        return match["number"], "updated"
+    number = existing.get(title)
+    if number:
+        github_request("PATCH", f"/repos/{repo}/issues/{number}", json={"body": body})
+        return number, "updated"
     else:
-        result = subprocess.run(
-            ["gh", "issue", "create", "--repo", repo, "--title", title,
-             "--label", "bill-triage", "--body-file", "-"],
-            input=body, text=True, capture_output=True, check=True,
+        issue = github_request(
+            "POST", f"/repos/{repo}/issues",
+            json={"title": title, "body": body, "labels": ["bill-triage"]},
         )
-        url = result.stdout.strip()
-        num = int(url.rstrip("/").split("/")[-1])
-        return num, "created"
+        return issue["number"], "created"
+
+
+def update_state_issue(supabase, repo, state, existing):
+    """Rebuild and upsert one state's triage issue. Returns a status line."""
+    try:
+        body, high, med, low = build_issue_body(supabase, state)
+        num, action = upsert_issue(repo, state, body, existing)
+        return f"  [{state}] {action} #{num} (high: {high}, med: {med}, low: {low})"
+    except Exception as e:
+        return f"  [{state}] ERROR: {e}"
 
 
 def main():
@@ -224,6 +371,10 @@ def main():
     parser.add_argument("--dry-run", action="store_true")
     parser.add_argument("--repo", default="PolicyEngine/state-legislative-tracker")
     parser.add_argument("--skip-issues", action="store_true", help="Only score, skip GitHub issue updates")
+    parser.add_argument("--batch-size", type=int, default=SCORING_BATCH_SIZE,
+                        help=f"Bills per Claude request (default: {SCORING_BATCH_SIZE}, 1 = one call per bill)")
+    parser.add_argument("--workers", type=int, default=SCORING_WORKERS,
+                        help=f"Scoring requests in flight at once (default: {SCORING_WORKERS})")
     args = parser.parse_args()
 
     for var in ["ANTHROPIC_API_KEY", "SUPABASE_URL", "SUPABASE_KEY"]:
@@ -245,38 +396,60 @@ def main():
     scored = 0
     errors = 0
 
-    for i, bill in enumerate(bills):
-        print(f"[{i+1}/{len(bills)}] {bill['state']} {bill['bill_number']}...", end=" ", flush=True)
-        try:
-            result = score_bill(client, bill)
-            score = int(result["score"])
-            reform_type = result["reform_type"]
-            reasoning = result["reasoning"][:500]
-
-            print(f"{score} ({reform_type})")
-
-            if not args.dry_run:
-                save_score(supabase, bill["bill_id"], score, reform_type, reasoning)
-                affected_states.add(bill["state"])
-
-            scored += 1
-        except Exception as e:
-            print(f"ERROR: {e}")
-            errors += 1
+    batch_size = max(1, args.batch_size)
+    batches = [bills[i:i + batch_size] for i in range(0, len(bills), batch_size)]
+    i = 0
+    # Score batches concurrently; map() hands them back in order, and
+    # Supabase writes stay on this thread
+    with ThreadPoolExecutor(max_workers=max(1, args.workers)) as pool:
+        for batch_scores, batch_error in pool.map(lambda batch: score_batch(client, batch), batches):
+            if batch_error:
+                print(f"Batch scoring failed ({batch_error}), scored individually")
+            for bill, result, error in batch_scores:
+                i += 1
+                print(f"[{i}/{len(bills)}] {bill['state']} {bill['bill_number']}...", end=" ", flush=True)
+                try:
+                    if error:
+                        raise error
+                    score = int(result["score"])
+                    reform_type = result["reform_type"]
+                    reasoning = result["reasoning"][:500]
+
+                    print(f"{score} ({reform_type})")
+
+                    if not args.dry_run:
+                        save_score(supabase, bill["bill_id"], score, reform_type, reasoning)
+                        affected_states.add(bill["state"])
+
+                    scored += 1
+                except Exception as e:
+                    print(f"ERROR: {e}")
+                    errors += 1
 
     print(f"\nScored: {scored}, Errors: {errors}")
 
     if args.dry_run or args.skip_issues or not affected_states:
         return 0
 
+    if not github_token():
+        print("Error: GH_TOKEN or GITHUB_TOKEN not set and no gh login found, skipping issue updates")
+        return 1
+
     print(f"\nUpdating GitHub issues for {len(affected_states)} states...")
-    for state in sorted(affected_states):
-        try:
-            body, high, med, low = build_issue_body(supabase, state)
-            num, action = upsert_issue(args.repo, state, body)
-            print(f"  [{state}] {action} #{num} (high: {high}, med: {med}, low: {low})")
-        except Exception as e:
-            print(f"  [{state}] ERROR: {e}")
+    # One listing of the open triage issues instead of a search per state
+    try:
+        existing = find_triage_issues(args.repo)
+    except Exception as e:
+        print(f"Error: could not list triage issues ({e}), skipping issue updates")
+        return 1
+    # States are independent, so overlap their network round-trips;
+    # map() keeps the printed results in state order
+    with ThreadPoolExecutor(max_workers=ISSUE_WORKERS) as pool:
+        for line in pool.map(
+            lambda state: update_state_issue(supabase, args.repo, state, existing),
+            sorted(affected_states),
+        ):
+            print(line)
 
     return 0
 
@@ -14,17 +14,19 @@ Usage:
     python scripts/compute_impacts.py --reform-id sc-h4216
     python scripts/compute_impacts.py --list
     python scripts/compute_impacts.py --force --reform-id ut-sb60
+    python scripts/compute_impacts.py --force --workers 4
 """
 
 import argparse
 import json
 import os
 import subprocess
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
+from functools import cached_property, lru_cache
 from pathlib import Path
 
 import numpy as np
-import yaml
 
 # Load environment variables from .env.local
 from dotenv import load_dotenv
@@ -39,7 +41,7 @@ from db_schema import (
     format_poverty_impact,
     format_winners_losers,
     format_decile_impact,
-    format_district_impact,
+    format_district_impacts_bulk,
 )
 
 # =============================================================================
@@ -75,6 +77,47 @@ STATE_DISTRICTS = {
 GAIN_LESS_5PCT_THRESHOLD = 0.001     # > 0.1% = winner
 NO_CHANGE_THRESHOLD = -0.001         # <= -0.1% = loser
 
+# Relative income change buckets matching API intra_decile_impact().
+# The inner bounds are the district thresholds, so district
+# loser/neutral/winner outcomes are a coarsening of these buckets.
+INCOME_CHANGE_BOUNDS = [-np.inf, -0.05, NO_CHANGE_THRESHOLD, GAIN_LESS_5PCT_THRESHOLD, 0.05, np.inf]
+INCOME_CHANGE_LABELS = [
+    "Lose more than 5%",
+    "Lose less than 5%",
+    "No change",
+    "Gain less than 5%",
+    "Gain more than 5%",
+]
+# Bucket index -> district outcome (0 = loser, 1 = no change, 2 = winner)
+DISTRICT_OUTCOME_BY_BUCKET = np.array([0, 0, 1, 2, 2])
+
+# Max reform_impacts rows per batched upsert
+WRITE_BATCH_SIZE = 50
+
+# Rows per page when reading reforms from the research table
+REFORM_PAGE_SIZE = 200
+
+
+# =============================================================================
+# PROGRESS OUTPUT
+# =============================================================================
+
+# Set by --quiet (in main() and in each worker process) to silence per-reform
+# progress lines; warnings, errors and the final summary are always printed
+_QUIET = False
+
+
+def set_quiet(quiet: bool):
+    """Enable or disable per-reform progress output for this process."""
+    global _QUIET
+    _QUIET = quiet
+
+
+def log(*args, **kwargs):
+    """Print a progress line unless running with --quiet."""
+    if not _QUIET:
+        print(*args, **kwargs)
+
 
 # =============================================================================
 # SUPABASE CLIENT
@@ -98,49 +141,97 @@ def get_supabase_client():
     return create_client(url, key)
 
 
-def load_reforms_from_db(supabase, reform_id=None):
-    """Load reform configs from database."""
-    query = supabase.table("research").select(
-        "id, state, title, description, url, reform_impacts(reform_params, computed)"
-    ).in_("type", ["bill", "blog"])
-
-    if reform_id:
-        query = query.eq("id", reform_id)
-
-    result = query.execute()
+def iter_reforms_from_db(
+    supabase, reform_id=None, page_size=REFORM_PAGE_SIZE,
+    list_only: bool = False, pending_only: bool = False,
+):
+    """Yield reform configs from database, fetching one page of rows at a time.
 
-    reforms = []
-    for r in result.data:
-        impact_data = r.get("reform_impacts")
-        if not impact_data:
-            continue
+    Rows without reform_params, or too malformed to parse, are skipped so a
+    single bad row cannot abort the whole load. With list_only, only the
+    columns --list prints are fetched (the yielded dicts carry id, state,
+    label and computed) and rows without reform_params are filtered out by
+    the query, so the listing matches what can be computed.
+    With pending_only, reforms already computed are filtered out by the
+    query itself, so their payloads are never transferred or parsed.
+    """
+    if list_only:
+        columns = "id, state, title, reform_impacts(computed)"
+    else:
+        columns = (
+            "id, state, title, description, url, "
+            "reform_impacts(reform_params, computed, policyengine_us_version)"
+        )
+    if pending_only or list_only:
+        # Inner join so the embedded filters drop whole research rows
+        columns = columns.replace("reform_impacts(", "reform_impacts!inner(")
+
+    offset = 0
+    while True:
+        query = supabase.table("research").select(columns).in_("type", ["bill", "blog"])
+
+        if reform_id:
+            query = query.eq("id", reform_id)
+        if pending_only:
+            query = query.not_.is_("reform_impacts.computed", "true")
+        if list_only:
+            query = query.not_.is_("reform_impacts.reform_params", "null")
+
+        result = query.order("id").range(offset, offset + page_size - 1).execute()
+        rows = result.data or []
+
+        for r in rows:
+            impact_data = r.get("reform_impacts")
+            if not impact_data:
+                continue
 
-        if isinstance(impact_data, list):
-            impact_data = impact_data[0] if impact_data else {}
+            if isinstance(impact_data, list):
+                impact_data = impact_data[0] if impact_data else {}
 
-        reform_params = impact_data.get("reform_params")
-        if not reform_params:
-            continue
+            if list_only:
+                yield {
+                    "id": r.get("id"),
+                    "state": (r.get("state") or "").lower(),
+                    "label": r.get("title"),
+                    "computed": impact_data.get("computed", False),
+                }
+                continue
 
-        reforms.append({
-            "id": r["id"],
-            "state": r["state"].lower(),
-            "label": r["title"],
-            "reform": reform_params,
-            "description": r.get("description", ""),
-            "bill_url": r.get("url"),
-            "computed": impact_data.get("computed", False),
-        })
+            reform_params = impact_data.get("reform_params")
+            if not reform_params:
+                continue
 
-    return reforms
+            try:
+                yield {
+                    "id": r["id"],
+                    "state": r["state"].lower(),
+                    "label": r["title"],
+                    "reform": reform_params,
+                    "description": r.get("description", ""),
+                    "bill_url": r.get("url"),
+                    "computed": impact_data.get("computed", False),
+                    "policyengine_us_version": impact_data.get("policyengine_us_version"),
+                }
+            except (KeyError, AttributeError) as e:
+                print(f"  Warning: skipping malformed reform row {r.get('id')!r}: {e}")
+
+        if len(rows) < page_size:
+            break
+        offset += page_size
+
+
+def load_reforms_from_db(supabase, reform_id=None, list_only: bool = False):
+    """Load reform configs from database."""
+    return list(iter_reforms_from_db(supabase, reform_id, list_only=list_only))
 
 
 # =============================================================================
 # MICROSIMULATION
 # =============================================================================
 
+@lru_cache(maxsize=None)
 def get_state_dataset(state: str) -> str:
-    """Download state-specific dataset from Hugging Face."""
+    """Download state-specific dataset from Hugging Face (once per state per process)."""
     try:
         from huggingface_hub import hf_hub_download
     except ImportError:
@@ -151,13 +242,13 @@ def get_state_dataset(state: str) -> str:
     state_upper = state.upper()
     filename = f"states/{state_upper}.h5"
 
-    print(f"    Downloading {state_upper} dataset from Hugging Face...")
+    log(f"    Downloading {state_upper} dataset from Hugging Face...")
     dataset_path = hf_hub_download(
         repo_id="policyengine/policyengine-us-data",
         filename=filename,
         repo_type="model",
     )
-    print(f"    Dataset ready: {dataset_path}")
+    log(f"    Dataset ready: {dataset_path}")
     return dataset_path
 
 
@@ -218,32 +309,39 @@ def create_reform_class(reform_params: dict):
         if not should_skip:
             filtered_params[param_path] = values
 
+    # Parse parameter paths and periods once, up front, so modify_params
+    # only has to walk attributes and apply updates
+    index_pattern = re.compile(r"(\w+)\[(\d+)\]")
+    compiled_params = []
+    for param_path, values in filtered_params.items():
+        # Split path and handle array indices like "brackets[0]"
+        steps = []
+        for part in param_path.split("."):
+            match = index_pattern.match(part)
+            if match:
+                steps.append((match.group(1), int(match.group(2))))
+            else:
+                steps.append((part, None))
+        updates = []
+        for period, value in values.items():
+            if "." in period and len(period) > 10:
+                start_str, stop_str = period.split(".")
+            else:
+                start_str = period if "-" in period else f"{period}-01-01"
+                stop_str = "2100-12-31"
+            updates.append((instant(start_str), instant(stop_str), value))
+        compiled_params.append((steps, updates))
+
     def modify_params(params):
-        for param_path, values in filtered_params.items():
+        for steps, updates in compiled_params:
             param = params
-            # Split path and handle array indices like "brackets[0]"
-            parts = param_path.split(".")
-            for part in parts:
-                # Check for array index notation: "brackets[0]"
-                match = re.match(r"(\w+)\[(\d+)\]", part)
-                if match:
-                    attr_name = match.group(1)
-                    index = int(match.group(2))
+            for attr_name, index in steps:
+                param = getattr(param, attr_name)
+                if index is not None:
                     # Get the list attribute and index into it
-                    param = getattr(param, attr_name)[index]
-                else:
-                    param = getattr(param, part)
-            for period, value in values.items():
-                if "." in period and len(period) > 10:
-                    start_str, stop_str = period.split(".")
-                else:
-                    start_str = period if "-" in period else f"{period}-01-01"
-                    stop_str = "2100-12-31"
-                param.update(
-                    start=instant(start_str),
-                    stop=instant(stop_str),
-                    value=value
-                )
+                    param = param[index]
+            for start, stop, value in updates:
+                param.update(start=start, stop=stop, value=value)
         return params
 
     # If using a built-in reform, combine it with parameter modifications
@@ -278,45 +376,149 @@ def create_reform_class(reform_params: dict):
     return DynamicReform
 
 
+# Variables kept in float64 when materialized. Revenue change is the
+# difference of two large weighted sums, so it needs full precision;
+# household net income feeds the relative-change buckets (whose edges a
+# float32 rounding can cross) and district benefit totals; entity ids must
+# stay exact. Every other statistic is reported at far coarser resolution
+# than float32 gives.
+FULL_PRECISION_VARIABLES = {
+    "state_income_tax", "tax_unit_weight", "household_id", "person_household_id",
+    "household_net_income",
+}
+
+
+class SimulationArrays(dict):
+    """
+    Raw NumPy arrays of a simulation's variables, keyed by variable name.
+
+    Each variable is calculated at most once (on first access) and then
+    shared by every impact function. Use a (name, map_to) tuple key for
+    entity projections, e.g. arrays["congressional_district_geoid", "person"].
+
+    float64 results are stored as float32 (except FULL_PRECISION_VARIABLES)
+    to halve memory traffic; reductions accumulate in float64.
+    """
+
+    def __init__(self, sim, year: int):
+        super().__init__()
+        self.sim = sim
+        self.year = year
+
+    def __missing__(self, key):
+        name, map_to = key if isinstance(key, tuple) else (key, None)
+        kwargs = {"map_to": map_to} if map_to else {}
+        values = np.asarray(self.sim.calculate(name, self.year, **kwargs).values)
+        if values.dtype == np.float64 and name not in FULL_PRECISION_VARIABLES:
+            values = values.astype(np.float32)
+        self[key] = values
+        return values
+
+    @cached_property
+    def is_child(self) -> np.ndarray:
+        """Person mask for age < 18, the API's child poverty filter."""
+        return self["age"] < 18
+
+
+# Baseline simulation (and its arrays per year) for the most recently
+# simulated state. main() orders reforms by state, so one entry gives full
+# reuse across a state's reforms while holding one baseline in memory.
+_BASELINE_CACHE = {}
+
+
+def get_baseline(state: str, year: int) -> SimulationArrays:
+    """Get baseline arrays for a state, reusing the previous reform's simulation."""
+    from policyengine_us import Microsimulation
+
+    if _BASELINE_CACHE.get("state") != state:
+        _BASELINE_CACHE.clear()
+        log("    Running baseline simulation...")
+        _BASELINE_CACHE["state"] = state
+        _BASELINE_CACHE["sim"] = Microsimulation(dataset=get_state_dataset(state))
+        _BASELINE_CACHE["arrays"] = {}
+    else:
+        log("    Reusing baseline simulation...")
+
+    arrays_by_year = _BASELINE_CACHE["arrays"]
+    if year not in arrays_by_year:
+        arrays_by_year[year] = SimulationArrays(_BASELINE_CACHE["sim"], year)
+    return arrays_by_year[year]
+
+
 def run_simulations(state: str, reform_params: dict, year: int = 2026):
     """
     Run baseline and reform microsimulations.
 
-    Returns tuple of (baseline, reformed) Microsimulation objects.
+    Returns tuple of (baseline, reformed) SimulationArrays. The baseline is
+    shared with other reforms for the same state and must not be mutated.
     """
     from policyengine_us import Microsimulation
 
     state_dataset = get_state_dataset(state)
     ReformClass = create_reform_class(reform_params)
 
-    print("    Running baseline simulation...")
-    baseline = Microsimulation(dataset=state_dataset)
+    baseline = get_baseline(state, year)
 
-    print("    Running reform simulation...")
+    log("    Running reform simulation...")
     reformed = Microsimulation(reform=ReformClass, dataset=state_dataset)
 
-    return baseline, reformed
+    return baseline, SimulationArrays(reformed, year)
 
 
 # =============================================================================
 # IMPACT CALCULATIONS (matching policyengine.py methodology)
 # =============================================================================
 
+def weighted_mean(values: np.ndarray, weights: np.ndarray) -> float:
+    """Weighted mean of raw arrays (same result as MicroSeries.mean())."""
+    return float(np.sum(values * weights, dtype=np.float64) / weights.sum(dtype=np.float64))
+
+
+def compute_income_change_bucket(baseline, reformed) -> np.ndarray:
+    """
+    Bucket each household's relative income change.
+
+    Returns an index into INCOME_CHANGE_LABELS per household. Computed once
+    per reform and shared by the statewide and district winners/losers.
+    """
+    baseline_income = baseline["household_net_income"]
+    # Relative change formula (matching API fix in policyengine-api#3283),
+    # divided in place so only the change and capped-income buffers are
+    # allocated (the shared baseline arrays are never written to)
+    relative_change = np.subtract(reformed["household_net_income"], baseline_income)
+    relative_change /= np.maximum(baseline_income, 1)
+    # side="left" gives the API's (change > lower) & (change <= upper) intervals
+    return np.searchsorted(INCOME_CHANGE_BOUNDS[1:-1], relative_change, side="left")
+
+
+def household_positions(baseline) -> np.ndarray:
+    """
+    Index of each person's household in the household-level arrays.
+
+    Lets household variables be projected onto persons with plain fancy
+    indexing instead of a PolicyEngine map_to="person" calculation.
+    """
+    household_id = baseline["household_id"]
+    order = np.argsort(household_id)
+    positions = np.searchsorted(household_id, baseline["person_household_id"], sorter=order)
+    return order[positions]
+
+
 def compute_budgetary_impact(baseline, reformed, state: str, year: int = 2026) -> dict:
     """
     Compute state revenue impact.
 
     Matches policyengine.py ProgramStatistics approach:
-    - calculate() returns weighted MicroSeries, so .sum() is already weighted
+    - state_income_tax summed with tax_unit_weight (MicroSeries.sum())
     - sum(household_weight raw values) for household count
     """
-    # calculate() returns MicroSeries with tax_unit_weight — .sum() is weighted
-    baseline_revenue = baseline.calculate("state_income_tax", year).sum()
-    reform_revenue = reformed.calculate("state_income_tax", year).sum()
+    # Weighted by tax_unit_weight, as calculate() would attach
+    baseline_revenue = np.dot(baseline["state_income_tax"], baseline["tax_unit_weight"])
+    reform_revenue = np.dot(reformed["state_income_tax"], reformed["tax_unit_weight"])
     revenue_change = float(reform_revenue - baseline_revenue)
 
     # Household count: sum of raw weight values (not weighted sum)
-    total_households = int(baseline.calculate("household_weight", year).values.sum())
+    total_households = int(baseline["household_weight"].sum(dtype=np.float64))
 
     return format_budgetary_impact(
         state_revenue_impact=revenue_change,
@@ -329,21 +531,22 @@ def compute_poverty_impact(baseline, reformed, state: str, year: int = 2026, chi
     Compute poverty rate change.
 
     Matches policyengine.py poverty_impact() exactly:
-    - calculate() returns weighted MicroSeries (person_weight)
+    - person_in_poverty weighted by person_weight
     - .mean() gives weighted poverty rate
     - Child filter: age < 18
     """
-    # calculate() returns MicroSeries with person_weight already attached
-    baseline_poverty = baseline.calculate("person_in_poverty", year)
-    reform_poverty = reformed.calculate("person_in_poverty", year)
+    baseline_poverty = baseline["person_in_poverty"]
+    reform_poverty = reformed["person_in_poverty"]
+    person_weight = baseline["person_weight"]
 
     if child_only:
-        age = baseline.calculate("age", year)
-        baseline_rate = float(baseline_poverty[age < 18].mean())
-        reform_rate = float(reform_poverty[age < 18].mean())
-    else:
-        baseline_rate = float(baseline_poverty.mean())
-        reform_rate = float(reform_poverty.mean())
+        is_child = baseline.is_child
+        baseline_poverty = baseline_poverty[is_child]
+        reform_poverty = reform_poverty[is_child]
+        person_weight = person_weight[is_child]
+
+    baseline_rate = weighted_mean(baseline_poverty, person_weight)
+    reform_rate = weighted_mean(reform_poverty, person_weight)
 
     return format_poverty_impact(
         baseline_rate=baseline_rate,
@@ -351,54 +554,39 @@ def compute_poverty_impact(baseline, reformed, state: str, year: int = 2026, chi
     )
 
 
-def compute_winners_losers(baseline, reformed, state: str, year: int = 2026) -> dict:
+def compute_winners_losers(baseline, reformed, state: str, year: int = 2026, income_change_bucket=None) -> dict:
     """
     Compute winners/losers breakdown.
 
     Matches policyengine.py intra_decile_impact() exactly:
-    - BOUNDS/LABELS loop with (income_change > lower) & (income_change <= upper)
+    - INCOME_CHANGE_BOUNDS buckets: (income_change > lower) & (income_change <= upper)
     - people[in_both].sum() / people[in_decile].sum() proportions
     - "all" = arithmetic mean of 10 decile proportions
     """
-    # calculate() returns weighted MicroSeries (household_weight)
-    baseline_income = baseline.calculate("household_net_income", year)
-    reform_income = reformed.calculate("household_net_income", year)
-    people = baseline.calculate("household_count_people", year)
-    decile = baseline.calculate("household_income_decile", year).values
-
-    # Relative change formula (matching API fix in policyengine-api#3283)
-    absolute_change = (reform_income - baseline_income).values
-    capped_baseline_income = np.maximum(baseline_income.values, 1)
-    income_change = absolute_change / capped_baseline_income
-
-    # BOUNDS/LABELS approach matching API intra_decile_impact()
+    if income_change_bucket is None:
+        income_change_bucket = compute_income_change_bucket(baseline, reformed)
+    bucket = income_change_bucket
+    decile = baseline["household_income_decile"]
+    num_groups = len(INCOME_CHANGE_LABELS)
+
+    weighted_people = baseline["household_count_people"] * baseline["household_weight"]
+
+    # One weighted histogram over (decile, bucket) fills the 10 x 5 table
+    in_range = (decile >= 1) & (decile <= 10)
+    flat_idx = (decile[in_range].astype(np.int64) - 1) * num_groups + bucket[in_range]
+    people_in_both = np.bincount(
+        flat_idx, weights=weighted_people[in_range], minlength=10 * num_groups,
+    ).reshape(10, num_groups)
+    people_in_decile = people_in_both.sum(axis=1, keepdims=True)
+    proportions = np.divide(
+        people_in_both, people_in_decile,
+        out=np.zeros_like(people_in_both), where=people_in_decile != 0,
+    )
+
     outcome_groups = {}
     all_outcomes = {}
-    BOUNDS = [-np.inf, -0.05, -1e-3, 1e-3, 0.05, np.inf]
-    LABELS = [
-        "Lose more than 5%",
-        "Lose less than 5%",
-        "No change",
-        "Gain less than 5%",
-        "Gain more than 5%",
-    ]
-    for lower, upper, label in zip(BOUNDS[:-1], BOUNDS[1:], LABELS):
-        outcome_groups[label] = []
-        for i in range(1, 11):
-            in_decile = decile == i
-            in_group = (income_change > lower) & (income_change <= upper)
-            in_both = in_decile & in_group
-
-            people_in_both = people[in_both].sum()
-            people_in_decile = people[in_decile].sum()
-
-            if people_in_decile == 0 and people_in_both == 0:
-                people_in_proportion = 0.0
-            else:
-                people_in_proportion = float(people_in_both / people_in_decile)
-
-            outcome_groups[label].append(people_in_proportion)
-
+    for j, label in enumerate(INCOME_CHANGE_LABELS):
+        outcome_groups[label] = proportions[:, j].tolist()
         all_outcomes[label] = sum(outcome_groups[label]) / 10
 
     # Map API labels to our frontend camelCase format
@@ -423,187 +611,252 @@ def compute_decile_impact(baseline, reformed, state: str, year: int = 2026) -> d
     Compute average income change by decile.
 
     Matches policyengine.py decile_impact() exactly:
-    - calculate() returns weighted MicroSeries (household_weight)
-    - groupby decile for relative and average breakdowns
+    - incomes weighted by household_weight
+    - grouped by decile for relative and average breakdowns
     - Filter out negative decile values (decile >= 0)
     """
-    # calculate() returns weighted MicroSeries (household_weight)
-    baseline_income = baseline.calculate("household_net_income", year)
-    reform_income = reformed.calculate("household_net_income", year)
-
     # Filter out negative decile values (matching API)
-    decile = baseline.calculate("household_income_decile", year)
-    baseline_income_filtered = baseline_income[decile >= 0]
-    reform_income_filtered = reform_income[decile >= 0]
-
-    income_change = reform_income_filtered - baseline_income_filtered
+    decile = baseline["household_income_decile"]
+    keep = decile >= 0
+    decile = decile[keep].astype(np.int64)
+    household_weight = baseline["household_weight"][keep]
+    baseline_income = baseline["household_net_income"][keep]
+    income_change = reformed["household_net_income"][keep] - baseline_income
+
+    # Weighted per-decile sums in single bincount passes (equivalent to the
+    # API's MicroSeries groupby(decile).sum() / .count())
+    households_by_decile = np.bincount(decile)
+    change_by_decile = np.bincount(decile, weights=income_change * household_weight)
+    baseline_by_decile = np.bincount(decile, weights=baseline_income * household_weight)
+    weight_by_decile = np.bincount(decile, weights=household_weight)
+    deciles = np.flatnonzero(households_by_decile)
 
     # Relative: weighted sum of change / weighted sum of baseline income
-    rel_income_change_by_decile = (
-        income_change.groupby(decile).sum()
-        / baseline_income_filtered.groupby(decile).sum()
-    )
-
     # Average: weighted sum of change / weighted count (sum of weights)
-    avg_income_change_by_decile = (
-        income_change.groupby(decile).sum()
-        / baseline_income_filtered.groupby(decile).count()
+    return format_decile_impact(
+        relative={int(d): float(change_by_decile[d] / baseline_by_decile[d]) for d in deciles},
+        average={int(d): float(change_by_decile[d] / weight_by_decile[d]) for d in deciles},
     )
 
-    rel_decile_dict = rel_income_change_by_decile.to_dict()
-    avg_decile_dict = avg_income_change_by_decile.to_dict()
 
-    return format_decile_impact(
-        relative={int(k): v for k, v in rel_decile_dict.items()},
-        average={int(k): v for k, v in avg_decile_dict.items()},
+def aggregate_districts(
+    district_idx, person_district_idx, household_income_decile, outcome,
+    household_weight, household_count_people, absolute_change,
+    person_weight, baseline_poverty_person, reform_poverty_person, person_is_child,
+    num_districts: int,
+):
+    """
+    Per-district household and person aggregates via np.bincount.
+
+    Returns (household_totals, people_by_outcome, person_totals):
+    household_totals[:, d] = rows, weighted households, total benefit;
+    people_by_outcome[d, decile, loser/neutral/winner] = weighted people;
+    person_totals[:, d] = persons, baseline poor, reform poor, children,
+    baseline poor children, reform poor children (all weighted).
+    Geoids outside the state's districts are dropped from every aggregate.
+    """
+    in_state = (district_idx >= 0) & (district_idx < num_districts)
+    person_in_state = (person_district_idx >= 0) & (person_district_idx < num_districts)
+
+    def by_district(idx, weights=None, mask=in_state, size=num_districts):
+        """Sum weights (or count rows) per district in a single pass."""
+        return np.bincount(
+            idx[mask],
+            weights=None if weights is None else weights[mask],
+            minlength=size,
+        )
+
+    household_totals = np.stack([
+        by_district(district_idx),
+        by_district(district_idx, household_weight),
+        # absolute_change is the caller's scratch buffer, so weight it in place
+        by_district(district_idx, np.multiply(absolute_change, household_weight, out=absolute_change)),
+    ])
+
+    # One weighted histogram over (district, decile, loser/neutral/winner)
+    in_decile_range = in_state & (household_income_decile >= 1) & (household_income_decile <= 10)
+    flat_idx = (
+        district_idx * 30
+        + (household_income_decile.astype(np.int64) - 1) * 3
+        + outcome
     )
+    people_by_outcome = by_district(
+        flat_idx, household_count_people * household_weight,
+        mask=in_decile_range, size=num_districts * 30,
+    ).reshape(num_districts, 10, 3)
+
+    # Compact the person arrays to in-state persons once, then reuse the
+    # compacted index/weights for every person-level aggregate
+    person_idx = person_district_idx[person_in_state]
+    person_weight = person_weight[person_in_state]
+    baseline_poor_weight = baseline_poverty_person[person_in_state] * person_weight
+    reform_poor_weight = reform_poverty_person[person_in_state] * person_weight
+    is_child = person_is_child[person_in_state]
+    child_idx = person_idx[is_child]
+
+    person_totals = np.stack([
+        np.bincount(idx, weights=weights, minlength=num_districts)
+        for idx, weights in (
+            (person_idx, person_weight),
+            (person_idx, baseline_poor_weight),
+            (person_idx, reform_poor_weight),
+            (child_idx, person_weight[is_child]),
+            (child_idx, baseline_poor_weight[is_child]),
+            (child_idx, reform_poor_weight[is_child]),
+        )
+    ])
+
+    return household_totals, people_by_outcome, person_totals
 
 
-def compute_district_impacts(baseline, reformed, state: str, year: int = 2026) -> dict:
+def compute_district_impacts(baseline, reformed, state: str, year: int = 2026, income_change_bucket=None) -> dict:
     """
     Compute impacts by congressional district.
 
-    Uses raw .values arrays for per-district slicing, then MicroSeries
-    for weighted aggregation within each district.
+    Groups households and persons by district in single weighted passes over
+    the raw arrays (see aggregate_districts) rather than a masked pass per
+    district.
     """
-    from microdf import MicroSeries
-
     state_upper = state.upper()
 
     if state_upper not in STATE_FIPS:
-        print(f"  Skipping district impacts: state {state_upper} not in STATE_FIPS")
+        log(f"  Skipping district impacts: state {state_upper} not in STATE_FIPS")
         return {}
 
+    # At-large states (and DC) have no per-district breakdown: the district
+    # map shows statewide impacts for them, so skip before touching any
+    # district or person-level arrays
     num_districts = STATE_DISTRICTS.get(state_upper, 0)
-    if num_districts == 0:
-        print(f"  Skipping district impacts: {state_upper} has no districts")
+    if num_districts <= 1:
+        log(f"  Skipping district impacts: {state_upper} has no multi-district map")
         return {}
 
     state_fips = STATE_FIPS[state_upper]
 
-    # Extract raw arrays for per-district slicing (can't use MicroSeries here
-    # because we need to create sub-arrays for each district)
-    baseline_income = baseline.calculate("household_net_income", year).values
-    reform_income = reformed.calculate("household_net_income", year).values
-    household_weight = baseline.calculate("household_weight", year).values
-    household_count_people = baseline.calculate("household_count_people", year).values
-    household_income_decile = baseline.calculate("household_income_decile", year).values
-    cd_geoid = baseline.calculate("congressional_district_geoid", year).values
+    # Raw arrays for per-district slicing
+    baseline_income = baseline["household_net_income"]
+    reform_income = reformed["household_net_income"]
+    household_weight = baseline["household_weight"]
+    household_count_people = baseline["household_count_people"]
+    household_income_decile = baseline["household_income_decile"]
+    cd_geoid = baseline["congressional_district_geoid"]
 
-    # Person-level raw arrays for per-district poverty
-    baseline_poverty_person = baseline.calculate("person_in_poverty", year).values.astype(float)
-    reform_poverty_person = reformed.calculate("person_in_poverty", year).values.astype(float)
-    person_weight = baseline.calculate("person_weight", year).values
-    person_age = baseline.calculate("age", year).values
-    person_cd_geoid = baseline.calculate("congressional_district_geoid", year, map_to="person").values
-
-    # Check if congressional district data is available
+    # Check if congressional district data is available before building
+    # any person-level projections
     unique_geoids = np.unique(cd_geoid)
     if len(unique_geoids) == 1 and unique_geoids[0] == 0:
         print("    Warning: Congressional district data not available")
         return {}
 
-    # Compute relative change for winners calculation (matching API fix in policyengine-api#3283)
-    absolute_change = reform_income - baseline_income
-    capped_baseline = np.maximum(baseline_income, 1)
-    relative_change = absolute_change / capped_baseline
+    # Zero-based district index per household/person; geoids outside this
+    # state's districts are dropped from every aggregate
+    district_idx = cd_geoid.astype(np.int64) - (state_fips * 100 + 1)
 
-    district_impacts = {}
+    # If no household's income changes, every district's impact is zero:
+    # skip the person-level work and emit zero-filled entries, so the map
+    # shows a zero impact rather than "no data"
+    absolute_change = reform_income - baseline_income
+    if not np.any(np.abs(absolute_change) > 1e-6):
+        log("    No household income change - districts get zero impacts")
+        in_state = (district_idx >= 0) & (district_idx < num_districts)
+        household_rows = np.bincount(district_idx[in_state], minlength=num_districts)
+        present = np.flatnonzero(household_rows)
+        households = np.bincount(
+            district_idx[in_state], weights=household_weight[in_state], minlength=num_districts,
+        )[present]
+        zeros = np.zeros(len(present))
+        district_nums = (present + 1).tolist()
+        return format_district_impacts_bulk(
+            district_ids=[f"{state_upper}-{n}" for n in district_nums],
+            district_names=[f"Congressional District {n}" for n in district_nums],
+            avg_benefit=zeros,
+            households_affected=households,
+            total_benefit=zeros,
+            winners_share=zeros,
+            losers_share=zeros,
+            poverty_pct_change=zeros,
+            child_poverty_pct_change=zeros,
+        )
 
-    for district_num in range(1, num_districts + 1):
-        district_geoid = state_fips * 100 + district_num
-        in_district = cd_geoid == district_geoid
+    # Person-level raw arrays for per-district poverty
+    baseline_poverty_person = baseline["person_in_poverty"].astype(np.float32)
+    reform_poverty_person = reformed["person_in_poverty"].astype(np.float32)
+    person_weight = baseline["person_weight"]
+    person_is_child = baseline.is_child
+    person_cd_geoid = cd_geoid[household_positions(baseline)]
+    person_district_idx = person_cd_geoid.astype(np.int64) - (state_fips * 100 + 1)
+
+    # Winners/losers use the same pattern as intra_decile_impact
+    if income_change_bucket is None:
+        income_change_bucket = compute_income_change_bucket(baseline, reformed)
+    outcome = DISTRICT_OUTCOME_BY_BUCKET[income_change_bucket]
+
+    household_totals, people_by_outcome, person_totals = aggregate_districts(
+        district_idx, person_district_idx, household_income_decile, outcome,
+        household_weight, household_count_people, absolute_change,
+        person_weight, baseline_poverty_person, reform_poverty_person, person_is_child,
+        num_districts,
+    )
 
-        if not np.any(in_district):
-            continue
+    # API: (reform.sum() - baseline.sum()) / baseline.count(), with
+    # weighted sum/count per district
+    household_rows, total_households, total_benefit = household_totals
 
-        # Average benefit using MicroSeries (matching API district approach)
-        baseline_district_income = MicroSeries(
-            baseline_income[in_district], weights=household_weight[in_district],
-        )
-        reform_district_income = MicroSeries(
-            reform_income[in_district], weights=household_weight[in_district],
-        )
-        # API: (reform.sum() - baseline.sum()) / baseline.count()
-        total_benefit = float(reform_district_income.sum() - baseline_district_income.sum())
-        total_households = float(baseline_district_income.count())
-        avg_benefit = total_benefit / total_households if total_households > 0 else 0
-
-        # Winners/losers using same pattern as intra_decile_impact
-        district_people = MicroSeries(
-            household_count_people[in_district],
-            weights=household_weight[in_district],
-        )
-        district_decile = household_income_decile[in_district]
-        district_relative = relative_change[in_district]
-        is_winner = district_relative > GAIN_LESS_5PCT_THRESHOLD
-        is_loser = district_relative <= NO_CHANGE_THRESHOLD
-
-        winner_proportions = []
-        loser_proportions = []
-        for decile in range(1, 11):
-            in_decile = district_decile == decile
-            if not np.any(in_decile):
-                winner_proportions.append(0.0)
-                loser_proportions.append(0.0)
-                continue
-            people_in_decile = district_people[in_decile].sum()
-            winners_in_decile = district_people[in_decile & is_winner].sum()
-            losers_in_decile = district_people[in_decile & is_loser].sum()
-            if people_in_decile == 0 and winners_in_decile == 0:
-                winner_proportions.append(0.0)
-            else:
-                winner_proportions.append(float(winners_in_decile / people_in_decile))
-            if people_in_decile == 0 and losers_in_decile == 0:
-                loser_proportions.append(0.0)
-            else:
-                loser_proportions.append(float(losers_in_decile / people_in_decile))
-
-        winners_share = sum(winner_proportions) / 10
-        losers_share = sum(loser_proportions) / 10
-
-        # Poverty using person_in_poverty and age < 18 (matching API poverty_impact)
-        in_district_person = person_cd_geoid == district_geoid
-        district_person_weight = person_weight[in_district_person]
-        district_baseline_poverty = baseline_poverty_person[in_district_person]
-        district_reform_poverty = reform_poverty_person[in_district_person]
-
-        if np.sum(district_person_weight) > 0:
-            bp = MicroSeries(district_baseline_poverty, weights=district_person_weight)
-            rp = MicroSeries(district_reform_poverty, weights=district_person_weight)
-            poverty_baseline = float(bp.mean())
-            poverty_reform = float(rp.mean())
-            poverty_pct_change = ((poverty_reform - poverty_baseline) / poverty_baseline * 100) if poverty_baseline > 0 else 0
-
-            # Child poverty: age < 18 (matching API)
-            district_age = person_age[in_district_person]
-            child_mask = district_age < 18
-            if np.any(child_mask):
-                bp_child = MicroSeries(district_baseline_poverty[child_mask], weights=district_person_weight[child_mask])
-                rp_child = MicroSeries(district_reform_poverty[child_mask], weights=district_person_weight[child_mask])
-                child_poverty_baseline = float(bp_child.mean())
-                child_poverty_reform = float(rp_child.mean())
-                child_poverty_pct_change = ((child_poverty_reform - child_poverty_baseline) / child_poverty_baseline * 100) if child_poverty_baseline > 0 else 0
-            else:
-                child_poverty_pct_change = 0
-        else:
-            poverty_pct_change = 0
-            child_poverty_pct_change = 0
-
-        district_id = f"{state_upper}-{district_num}"
-        district_impacts[district_id] = format_district_impact(
-            district_id=district_id,
-            district_name=f"Congressional District {district_num}",
-            avg_benefit=avg_benefit,
-            households_affected=int(total_households),
-            total_benefit=total_benefit,
-            winners_share=winners_share,
-            losers_share=losers_share,
-            poverty_pct_change=poverty_pct_change,
-            child_poverty_pct_change=child_poverty_pct_change,
+    people_in_decile = people_by_outcome.sum(axis=2)
+    has_people = people_in_decile != 0
+    loser_proportions = np.divide(
+        people_by_outcome[:, :, 0], people_in_decile,
+        out=np.zeros_like(people_in_decile), where=has_people,
+    )
+    winner_proportions = np.divide(
+        people_by_outcome[:, :, 2], people_in_decile,
+        out=np.zeros_like(people_in_decile), where=has_people,
+    )
+    winners_share = winner_proportions.sum(axis=1) / 10
+    losers_share = loser_proportions.sum(axis=1) / 10
+
+    # Poverty using person_in_poverty and age < 18 (matching API poverty_impact)
+    (
+        person_total, baseline_poor, reform_poor,
+        child_total, baseline_child_poor, reform_child_poor,
+    ) = person_totals
+
+    def pct_change(baseline_num, reform_num, denom):
+        """Relative % change in weighted rate per district, 0 where undefined."""
+        has_people = denom > 0
+        baseline_rate = np.divide(baseline_num, denom, out=np.zeros_like(baseline_num), where=has_people)
+        reform_rate = np.divide(reform_num, denom, out=np.zeros_like(reform_num), where=has_people)
+        return np.divide(
+            (reform_rate - baseline_rate) * 100, baseline_rate,
+            out=np.zeros_like(baseline_rate), where=baseline_rate > 0,
         )
 
-        print(f"    District {district_num}: ${avg_benefit:.0f} avg, {winners_share:.1%} winners, {losers_share:.1%} losers")
+    # Districts with at least one household row, formatted column-wise
+    present = np.flatnonzero(household_rows)
+    households = total_households[present]
+    benefit = total_benefit[present]
+    avg_benefit = np.divide(benefit, households, out=np.zeros_like(benefit), where=households > 0)
+    district_nums = (present + 1).tolist()
+
+    district_impacts = format_district_impacts_bulk(
+        district_ids=[f"{state_upper}-{n}" for n in district_nums],
+        district_names=[f"Congressional District {n}" for n in district_nums],
+        avg_benefit=avg_benefit,
+        households_affected=households,
+        total_benefit=benefit,
+        winners_share=winners_share[present],
+        losers_share=losers_share[present],
+        poverty_pct_change=pct_change(baseline_poor, reform_poor, person_total)[present],
+        child_poverty_pct_change=pct_change(
+            baseline_child_poor, reform_child_poor, child_total,
+        )[present],
+    )
+
+    if not _QUIET:
+        for n, avg, winners, losers in zip(
+            district_nums, avg_benefit, winners_share[present], losers_share[present],
+        ):
+            log(f"    District {n}: ${avg:.0f} avg, {winners:.1%} winners, {losers:.1%} losers")
 
     return district_impacts
 
@@ -612,8 +865,9 @@ def compute_district_impacts(baseline, reformed, state: str, year: int = 2026) -
 # DATABASE WRITE
 # =============================================================================
 
+@lru_cache(maxsize=None)
 def get_installed_version(package_name: str) -> str:
-    """Get version of an installed Python package."""
+    """Get version of an installed Python package (looked up once per process)."""
     try:
         from importlib.metadata import version
         return version(package_name)
@@ -621,6 +875,14 @@ def get_installed_version(package_name: str) -> str:
         return "unknown"
 
 
+def get_package_versions() -> dict:
+    """Installed versions of the packages recorded on reform_impacts rows."""
+    return {
+        name: get_installed_version(name)
+        for name in ("policyengine-us", "policyengine-us-data")
+    }
+
+
 def get_effective_year_from_params(reform_params: dict) -> int:
     """Extract the earliest effective year from reform params."""
     earliest_year = 2100
@@ -644,36 +906,34 @@ def get_effective_year_from_params(reform_params: dict) -> int:
     return earliest_year if earliest_year < 2100 else 2026
 
 
-def _resolve_pe_us_version(supabase, reform_id: str, reform_params: dict) -> str:
+def _resolve_pe_us_version(stored_version: str = None, installed_version: str = None) -> str:
     """Determine the policyengine-us version to store.
 
-    On re-runs (--force) where reform_params haven't changed, preserve the
-    existing version to avoid spuriously bumping it. The stored version acts
-    as "minimum API version needed", not "version last computed with".
+    On re-runs (--force), preserve the version already stored for the reform
+    to avoid spuriously bumping it. The stored version acts as "minimum API
+    version needed", not "version last computed with". reform_params are
+    loaded from the same row and never rewritten here, so they are unchanged
+    by construction.
     """
-    current_version = get_installed_version("policyengine-us")
-
-    existing = supabase.table("reform_impacts").select(
-        "policyengine_us_version, reform_params"
-    ).eq("id", reform_id).execute()
+    return stored_version or installed_version or get_installed_version("policyengine-us")
 
-    if existing.data and len(existing.data) > 0:
-        old_version = existing.data[0].get("policyengine_us_version")
-        old_params = existing.data[0].get("reform_params")
-        # If params unchanged and we already have a version, keep the older one
-        if old_version and old_params == reform_params:
-            return old_version
 
-    return current_version
-
-
-def write_to_supabase(supabase, reform_id: str, impacts: dict, reform_params: dict, analysis_year: int, multi_year: bool = False):
-    """Write impacts to Supabase reform_impacts table.
+def build_impacts_record(
+    supabase, reform_id: str, impacts: dict, analysis_year: int, multi_year: bool = False,
+    stored_pe_us_version: str = None, package_versions: dict = None,
+) -> dict:
+    """Build the reform_impacts row for a reform (written later by write_to_supabase).
 
     If multi_year=True, stores impacts in model_notes.impacts_by_year[year] instead of
     overwriting the main impact fields. This allows storing multiple years of impacts.
+
+    reform_params are left out of the row: they were read from this same row,
+    so the upsert leaves them as stored instead of re-sending them.
+    package_versions (from get_package_versions) is resolved once by main().
     """
-    pe_us_version = _resolve_pe_us_version(supabase, reform_id, reform_params)
+    if package_versions is None:
+        package_versions = get_package_versions()
+    pe_us_version = _resolve_pe_us_version(stored_pe_us_version, package_versions["policyengine-us"])
 
     if multi_year:
         import json
@@ -726,11 +986,10 @@ def write_to_supabase(supabase, reform_id: str, impacts: dict, reform_params: di
             "winners_losers": impacts["winnersLosers"],
             "decile_impact": impacts["decileImpact"],
             "district_impacts": impacts.get("districtImpacts"),
-            "reform_params": reform_params,
             "model_notes": model_notes,
             "policyengine_us_version": pe_us_version,
             "dataset_name": "policyengine-us-data",
-            "dataset_version": get_installed_version("policyengine-us-data"),
+            "dataset_version": package_versions["policyengine-us-data"],
         }
     else:
         model_notes = {
@@ -747,23 +1006,30 @@ def write_to_supabase(supabase, reform_id: str, impacts: dict, reform_params: di
             "winners_losers": impacts["winnersLosers"],
             "decile_impact": impacts["decileImpact"],
             "district_impacts": impacts.get("districtImpacts"),
-            "reform_params": reform_params,
             "model_notes": model_notes,
             "policyengine_us_version": pe_us_version,
             "dataset_name": "policyengine-us-data",
-            "dataset_version": get_installed_version("policyengine-us-data"),
+            "dataset_version": package_versions["policyengine-us-data"],
         }
 
-    result = supabase.table("reform_impacts").upsert(record).execute()
-    return result
+    return record
+
+
+def write_to_supabase(supabase, records: list):
+    """Upsert reform_impacts rows in a single round-trip.
+
+    Uses return=minimal: nothing reads the written rows back, so the server
+    skips echoing them and the client skips parsing them.
+    """
+    return supabase.table("reform_impacts").upsert(records, returning="minimal").execute()
 
 
 # =============================================================================
 # STATUS UPDATE
 # =============================================================================
 
-def update_research_status(supabase, reform_id: str, status: str):
-    """Update the research table status for a reform.
+def update_research_status(supabase, reform_ids: list, status: str):
+    """Update the research table status for one or more reforms.
 
     Only 'in_review' is allowed here. The 'published' status must ONLY
     be set by the publish-bill GitHub Action on PR merge.
@@ -775,10 +1041,185 @@ def update_research_status(supabase, reform_id: str, status: str):
             f"Allowed: {ALLOWED_STATUSES}. "
             f"'published' can only be set by the publish-bill GitHub Action on PR merge."
         )
-    result = supabase.table("research").update({"status": status}).eq("id", reform_id).execute()
+    result = supabase.table("research").update(
+        {"status": status}, returning="minimal",
+    ).in_("id", reform_ids).execute()
     return result
 
 
+def get_research_statuses(supabase, reform_ids: list) -> dict:
+    """Get the current research table status for each reform id."""
+    rows = supabase.table("research").select("id, status").in_("id", reform_ids).execute().data
+    return {r["id"]: r.get("status") for r in rows}
+
+
+def _write_impact_batch(supabase, batch: list, results: dict):
+    """Upsert one batch of reform_impacts rows, then mark them in_review.
+
+    The status lookup overlaps the upsert; the status update only runs once
+    the batch has been written. Raises if the write fails.
+    """
+    reform_ids = [record["id"] for record in batch]
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        write_future = pool.submit(write_to_supabase, supabase, batch)
+        status_future = pool.submit(get_research_statuses, supabase, reform_ids)
+        write_future.result()
+        statuses = status_future.result()
+
+    # Set status to in_review (skip if already published to avoid taking bills offline)
+    to_review = []
+    for reform_id in reform_ids:
+        if statuses.get(reform_id) == "published":
+            print(f"  {reform_id}: status already 'published' — preserving (not resetting to in_review)")
+        else:
+            to_review.append(reform_id)
+    if to_review:
+        log(f"  Setting status to in_review for {len(to_review)} reform(s)...")
+        update_research_status(supabase, to_review, "in_review")
+
+    for reform_id in reform_ids:
+        results[reform_id] = "computed"
+
+
+def flush_impact_writes(supabase, records: list, results: dict):
+    """Write queued reform_impacts rows in batches, then mark them in_review.
+
+    If a batch fails, its rows are retried one at a time so a single bad row
+    does not fail the rest of the batch. Updates results[reform_id].
+    """
+    for start in range(0, len(records), WRITE_BATCH_SIZE):
+        batch = records[start:start + WRITE_BATCH_SIZE]
+        try:
+            _write_impact_batch(supabase, batch, results)
+            continue
+        except Exception as e:
+            if len(batch) == 1:
+                print(f"  [ERROR] Write failed for {batch[0]['id']}: {e}")
+                results[batch[0]["id"]] = f"error: {e}"
+                continue
+            print(f"  [WARN] Batch write failed ({e}); retrying {len(batch)} rows individually")
+
+        for record in batch:
+            try:
+                _write_impact_batch(supabase, [record], results)
+            except Exception as e:
+                print(f"  [ERROR] Write failed for {record['id']}: {e}")
+                results[record["id"]] = f"error: {e}"
+
+
+# =============================================================================
+# PER-REFORM PROCESSING
+# =============================================================================
+
+@lru_cache(maxsize=None)
+def _worker_supabase_client():
+    """One Supabase client per worker process, created on first use."""
+    return get_supabase_client()
+
+
+def process_reform(
+    reform: dict, year: int = None, multi_year: bool = False, supabase=None,
+    computed_at: str = None, package_versions: dict = None,
+):
+    """Run simulations and compute all impacts for a single reform.
+
+    Returns (status, record): record is the reform_impacts row to write, or
+    None if the reform failed. Safe to run in a worker process; the Supabase
+    client is only needed for --multi-year, and a worker then creates one
+    per process. computed_at and package_versions are resolved once per run
+    by main().
+    """
+    if supabase is None and multi_year:
+        supabase = _worker_supabase_client()
+
+    reform_id = reform["id"]
+    state = reform["state"]
+
+    log(f"\n{'-' * 60}")
+    log(f"Reform: {reform['label']}")
+    log(f"ID: {reform_id} | State: {state.upper()}")
+    log(f"{'-' * 60}")
+
+    try:
+        # Determine simulation year: use --year if provided, otherwise detect from reform params
+        if year:
+            sim_year = year
+        else:
+            sim_year = get_effective_year_from_params(reform["reform"])
+        log(f"  Analysis year: {sim_year}")
+
+        # Run simulations
+        log("  [1/6] Running microsimulations...")
+        # Each variable is calculated once per simulation and shared
+        # across all impact functions below
+        baseline, reformed = run_simulations(state, reform["reform"], sim_year)
+
+        # Compute all impacts
+        log("  [2/6] Computing budgetary impact...")
+        budgetary_impact = compute_budgetary_impact(baseline, reformed, state, sim_year)
+        log(f"        Revenue change: ${budgetary_impact['stateRevenueImpact']:,.0f}")
+
+        log("  [3/6] Computing poverty impact...")
+        poverty_impact = compute_poverty_impact(baseline, reformed, state, sim_year)
+        log(f"        Baseline: {poverty_impact['baselineRate']:.2%} -> Reform: {poverty_impact['reformRate']:.2%}")
+
+        log("  [4/6] Computing child poverty impact...")
+        child_poverty_impact = compute_poverty_impact(baseline, reformed, state, sim_year, child_only=True)
+
+        log("  [5/6] Computing winners/losers...")
+        income_change_bucket = compute_income_change_bucket(baseline, reformed)
+        winners_losers = compute_winners_losers(
+            baseline, reformed, state, sim_year, income_change_bucket=income_change_bucket,
+        )
+        gain_total = winners_losers['gainMore5Pct'] + winners_losers['gainLess5Pct']
+        lose_total = winners_losers['loseLess5Pct'] + winners_losers['loseMore5Pct']
+        log(f"        Winners: {gain_total:.1%} | No change: {winners_losers['noChange']:.1%} | Losers: {lose_total:.1%}")
+
+        log("  [6/6] Computing decile and district impacts...")
+        decile_impact = compute_decile_impact(baseline, reformed, state, sim_year)
+        district_impacts = compute_district_impacts(
+            baseline, reformed, state, sim_year, income_change_bucket=income_change_bucket,
+        )
+
+        # Assemble results
+        impacts = {
+            "computed": True,
+            "computedAt": computed_at or datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "budgetaryImpact": budgetary_impact,
+            "povertyImpact": poverty_impact,
+            "childPovertyImpact": child_poverty_impact,
+            "winnersLosers": winners_losers,
+            "decileImpact": decile_impact,
+        }
+        if district_impacts:
+            impacts["districtImpacts"] = district_impacts
+
+        # Build the database row; rows are upserted in batches by main()
+        record = build_impacts_record(
+            supabase, reform_id, impacts, sim_year, multi_year,
+            stored_pe_us_version=reform.get("policyengine_us_version"),
+            package_versions=package_versions,
+        )
+
+        log("\n  [OK] Computed (queued for Supabase write)")
+        return "pending write", record
+
+    except Exception as e:
+        print(f"  [ERROR] {e}")
+        import traceback
+        traceback.print_exc()
+        return f"error: {e}", None
+
+
+def process_state_reforms(reforms: list, **kwargs) -> list:
+    """Process same-state reforms in order, sharing one baseline simulation.
+
+    Worker-process entry point: returns process_reform's (status, record)
+    for each reform, in the order given.
+    """
+    return [process_reform(reform, **kwargs) for reform in reforms]
+
+
 # =============================================================================
 # MAIN
 # =============================================================================
@@ -797,6 +1238,9 @@ Examples:
 
     # Force recomputation
     python scripts/compute_impacts.py --force --reform-id ut-sb60
+
+    # Recompute everything across four worker processes
+    python scripts/compute_impacts.py --force --workers 4
         """
     )
     parser.add_argument(
@@ -825,7 +1269,20 @@ Examples:
         action="store_true",
         help="Store impacts in impacts_by_year structure (for multi-year analysis)"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of worker processes, each computing one state's reforms at a time "
+             "(default: 1; 0 = one per CPU; each holds a full state dataset in memory)"
+    )
+    parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help="Only print warnings, errors and the final summary"
+    )
     args = parser.parse_args()
+    set_quiet(args.quiet)
 
     # Require Supabase
     supabase = get_supabase_client()
@@ -838,110 +1295,120 @@ Examples:
     print("PolicyEngine Impact Calculator (Local)")
     print("=" * 60)
 
-    # Load reforms from database
-    reforms = load_reforms_from_db(supabase, args.reform_id)
-
-    if not reforms:
-        if args.reform_id:
-            print(f"\nError: Reform '{args.reform_id}' not found or has no reform_params")
-        else:
-            print("\nNo reforms found with type='bill' and reform_params set")
-        return 1
-
     # List mode
     if args.list:
+        reforms = load_reforms_from_db(supabase, args.reform_id, list_only=True)
+        if not reforms:
+            print("\nNo reforms found with type='bill' and a reform_impacts row")
+            return 1
         print(f"\nFound {len(reforms)} reform(s):\n")
-        for r in reforms:
-            status = "computed" if r["computed"] else "pending"
-            print(f"  {r['id']:30} [{r['state'].upper()}] ({status})")
+        print("\n".join(
+            f"  {r['id']:30} [{r['state'].upper()}] ({'computed' if r['computed'] else 'pending'})"
+            for r in reforms
+        ))
         return 0
 
-    print(f"\nProcessing {len(reforms)} reform(s)...")
-
+    # Stream reforms page by page, keeping only those that need computing.
+    # Without --force, computed reforms are filtered out server-side, except
+    # for a named --reform-id so it can still report "already computed".
+    pending_only = not args.force and not args.reform_id
     results = {}
-
-    for reform in reforms:
-        reform_id = reform["id"]
-        state = reform["state"]
-
-        print(f"\n{'-' * 60}")
-        print(f"Reform: {reform['label']}")
-        print(f"ID: {reform_id} | State: {state.upper()}")
-        print(f"{'-' * 60}")
-
+    to_compute = []
+    for reform in iter_reforms_from_db(supabase, args.reform_id, pending_only=pending_only):
         # Skip if already computed (unless forced)
         if not args.force and reform["computed"]:
-            print("  Already computed (use --force to recompute)")
-            results[reform_id] = "skipped"
+            log(f"\n  {reform['id']}: already computed (use --force to recompute)")
+            results[reform["id"]] = "skipped"
             continue
+        results[reform["id"]] = "pending"
+        to_compute.append(reform)
 
-        try:
-            # Determine simulation year: use --year if provided, otherwise detect from reform params
-            if args.year:
-                sim_year = args.year
-            else:
-                sim_year = get_effective_year_from_params(reform["reform"])
-            print(f"  Analysis year: {sim_year}")
-
-            # Run simulations
-            print("  [1/6] Running microsimulations...")
-            baseline, reformed = run_simulations(state, reform["reform"], sim_year)
-
-            # Compute all impacts
-            print("  [2/6] Computing budgetary impact...")
-            budgetary_impact = compute_budgetary_impact(baseline, reformed, state, sim_year)
-            print(f"        Revenue change: ${budgetary_impact['stateRevenueImpact']:,.0f}")
-
-            print("  [3/6] Computing poverty impact...")
-            poverty_impact = compute_poverty_impact(baseline, reformed, state, sim_year)
-            print(f"        Baseline: {poverty_impact['baselineRate']:.2%} -> Reform: {poverty_impact['reformRate']:.2%}")
-
-            print("  [4/6] Computing child poverty impact...")
-            child_poverty_impact = compute_poverty_impact(baseline, reformed, state, sim_year, child_only=True)
-
-            print("  [5/6] Computing winners/losers...")
-            winners_losers = compute_winners_losers(baseline, reformed, state, sim_year)
-            gain_total = winners_losers['gainMore5Pct'] + winners_losers['gainLess5Pct']
-            lose_total = winners_losers['loseLess5Pct'] + winners_losers['loseMore5Pct']
-            print(f"        Winners: {gain_total:.1%} | No change: {winners_losers['noChange']:.1%} | Losers: {lose_total:.1%}")
-
-            print("  [6/6] Computing decile and district impacts...")
-            decile_impact = compute_decile_impact(baseline, reformed, state, sim_year)
-            district_impacts = compute_district_impacts(baseline, reformed, state, sim_year)
-
-            # Assemble results
-            impacts = {
-                "computed": True,
-                "computedAt": datetime.now(timezone.utc).isoformat(),
-                "budgetaryImpact": budgetary_impact,
-                "povertyImpact": poverty_impact,
-                "childPovertyImpact": child_poverty_impact,
-                "winnersLosers": winners_losers,
-                "decileImpact": decile_impact,
-            }
-            if district_impacts:
-                impacts["districtImpacts"] = district_impacts
-
-            # Write to database
-            print("  Writing to Supabase...")
-            write_to_supabase(supabase, reform_id, impacts, reform["reform"], sim_year, args.multi_year)
+    if not results:
+        if pending_only:
+            print("\nNo uncomputed reforms found (use --force to recompute)")
+            return 0
+        if args.reform_id:
+            print(f"\nError: Reform '{args.reform_id}' not found or has no reform_params")
+        else:
+            print("\nNo reforms found with type='bill' and reform_params set")
+        return 1
 
-            # Set status to in_review (skip if already published to avoid taking bills offline)
-            current_status = supabase.table("research").select("status").eq("id", reform_id).execute().data
-            if current_status and current_status[0].get("status") == "published":
-                print("  Status already 'published' — preserving (not resetting to in_review)")
-            else:
-                print("  Setting status to in_review...")
-                update_research_status(supabase, reform_id, "in_review")
+    print(f"\nProcessing {len(results)} reform(s)...")
 
-            print(f"\n  [OK] Complete!")
-            results[reform_id] = "computed"
+    # Group same-state reforms so consecutive reforms share a baseline
+    to_compute.sort(key=lambda reform: reform["state"])
 
+    # Download each state's dataset once up front so failures surface early
+    # and worker processes find the files already in the Hugging Face cache
+    for state in sorted({reform["state"] for reform in to_compute}):
+        try:
+            get_state_dataset(state)
         except Exception as e:
-            print(f"  [ERROR] {e}")
-            import traceback
-            traceback.print_exc()
-            results[reform_id] = f"error: {e}"
+            print(f"  Warning: could not prefetch {state.upper()} dataset: {e}")
+
+    # One timestamp and one set of package versions for the whole run
+    computed_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
+    package_versions = get_package_versions()
+
+    pending_records = []  # finished reform_impacts rows not yet upserted
+
+    def flush_pending():
+        """Write the queued rows now, so finished work survives a later crash."""
+        if pending_records:
+            log(f"\n  Writing {len(pending_records)} reform(s) to Supabase...")
+            flush_impact_writes(supabase, pending_records, results)
+            pending_records.clear()
+
+    def queue_outcome(reform, status, record):
+        """Record a reform's status and queue its row, writing full batches."""
+        results[reform["id"]] = status
+        if record is not None:
+            pending_records.append(record)
+            if len(pending_records) >= WRITE_BATCH_SIZE:
+                flush_pending()
+
+    # Same-state reforms go to the same worker so its baseline is reused
+    reforms_by_state = {}
+    for reform in to_compute:
+        reforms_by_state.setdefault(reform["state"], []).append(reform)
+    workers = args.workers if args.workers > 0 else (os.cpu_count() or 1)
+    workers = min(workers, len(reforms_by_state))
+
+    # Rows are written as each state's reforms finish (or whenever a full
+    # batch is queued), not held back until the end of the run
+    if workers > 1:
+        # Each worker builds its own simulations and Supabase client
+        print(f"Computing {len(to_compute)} reform(s) with {workers} worker processes...")
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=set_quiet, initargs=(args.quiet,),
+        ) as pool:
+            futures = {
+                pool.submit(
+                    process_state_reforms, state_reforms, year=args.year,
+                    multi_year=args.multi_year, computed_at=computed_at,
+                    package_versions=package_versions,
+                ): state_reforms
+                for state_reforms in reforms_by_state.values()
+            }
+            for future in as_completed(futures):
+                state_reforms = futures[future]
+                try:
+                    state_outcomes = future.result()
+                except Exception as e:
+                    # A crashed worker fails only its own state's reforms
+                    print(f"  [ERROR] Worker for {state_reforms[0]['state'].upper()} failed: {e}")
+                    state_outcomes = [(f"error: {e}", None)] * len(state_reforms)
+                for reform, (status, record) in zip(state_reforms, state_outcomes):
+                    queue_outcome(reform, status, record)
+                flush_pending()
+    else:
+        for state_reforms in reforms_by_state.values():
+            for reform in state_reforms:
+                status, record = process_reform(
+                    reform, args.year, args.multi_year, supabase, computed_at, package_versions,
+                )
+                queue_outcome(reform, status, record)
+            flush_pending()
 
     # Summary
     print(f"\n{'=' * 60}")
@@ -9,7 +9,12 @@ the frontend can read the data correctly.
 """
 
 from typing import Optional
-from datetime import datetime
+from datetime import datetime, timezone
+
+import numpy as np
+
+# String keys for the 10 income deciles, as stored in JSON columns
+_DECILE_KEYS = ("1", "2", "3", "4", "5", "6", "7", "8", "9", "10")
 
 
 def format_budgetary_impact(
@@ -137,15 +142,24 @@ def format_winners_losers(
             "loseLess5Pct": lose_less_5pct,
             "loseMore5Pct": lose_more_5pct,
         }
-        deciles = {}
-        for i in range(10):
-            deciles[str(i + 1)] = {
-                "gainMore5Pct": decile_breakdown["gain_more_5pct"][i],
-                "gainLess5Pct": decile_breakdown["gain_less_5pct"][i],
-                "noChange": decile_breakdown["no_change"][i],
-                "loseLess5Pct": decile_breakdown["lose_less_5pct"][i],
-                "loseMore5Pct": decile_breakdown["lose_more_5pct"][i],
+        deciles = {
+            key: {
+                "gainMore5Pct": gain_more,
+                "gainLess5Pct": gain_less,
+                "noChange": unchanged,
+                "loseLess5Pct": lose_less,
+                "loseMore5Pct": lose_more,
             }
+            for key, gain_more, gain_less, unchanged, lose_less, lose_more in zip(
+                _DECILE_KEYS,
+                decile_breakdown["gain_more_5pct"],
+                decile_breakdown["gain_less_5pct"],
+                decile_breakdown["no_change"],
+                decile_breakdown["lose_less_5pct"],
+                decile_breakdown["lose_more_5pct"],
+                strict=True,
+            )
+        }
         result["intraDecile"] = {
             "all": all_row,
             "deciles": deciles,
@@ -171,8 +185,8 @@ def format_decile_impact(relative: dict, average: dict) -> dict:
         string decile keys to values.
     """
     return {
-        "relative": {str(k): v for k, v in relative.items()},
-        "average": {str(k): v for k, v in average.items()},
+        "relative": dict(zip(map(str, relative), relative.values())),
+        "average": dict(zip(map(str, average), average.values())),
     }
 
 
@@ -219,6 +233,58 @@ def format_district_impact(
     }
 
 
+def format_district_impacts_bulk(
+    district_ids: list,
+    district_names: list,
+    avg_benefit: np.ndarray,
+    households_affected: np.ndarray,
+    total_benefit: np.ndarray,
+    winners_share: np.ndarray,
+    losers_share: np.ndarray,
+    poverty_pct_change: np.ndarray,
+    child_poverty_pct_change: np.ndarray,
+) -> dict:
+    """
+    Format impacts for many districts from per-district arrays.
+
+    Produces the same entries as format_district_impact, but rounds each
+    field once over the whole array instead of once per district.
+
+    Args:
+        district_ids: District identifiers (e.g., ["SC-1", "SC-2"])
+        district_names: Human-readable names, aligned with district_ids
+        Remaining args: one array per format_district_impact field,
+            aligned with district_ids (households_affected as whole numbers)
+
+    Returns:
+        Dict of district_id -> district impact, matching DistrictMap.jsx
+    """
+    columns = zip(
+        district_names,
+        np.round(avg_benefit, 0).tolist(),
+        np.asarray(households_affected, dtype=np.int64).tolist(),
+        np.round(total_benefit, 0).tolist(),
+        np.round(winners_share, 2).tolist(),
+        np.round(losers_share, 2).tolist(),
+        np.round(poverty_pct_change, 2).tolist(),
+        np.round(child_poverty_pct_change, 2).tolist(),
+    )
+    return {
+        district_id: {
+            "districtName": name,
+            "avgBenefit": avg,
+            "householdsAffected": households,
+            "totalBenefit": total,
+            "winnersShare": winners,
+            "losersShare": losers,
+            "povertyPctChange": poverty,
+            "childPovertyPctChange": child_poverty,
+        }
+        for district_id, (name, avg, households, total, winners, losers, poverty, child_poverty)
+        in zip(district_ids, columns)
+    }
+
+
 def format_reform_impacts_record(
     reform_id: str,
     budgetary_impact: dict,
@@ -258,7 +324,7 @@ def format_reform_impacts_record(
     return {
         "id": reform_id,
         "computed": computed,
-        "computed_at": datetime.utcnow().isoformat() if computed else None,
+        "computed_at": datetime.now(timezone.utc).isoformat() if computed else None,
         "policy_id": policy_id,
         "budgetary_impact": budgetary_impact,
         "poverty_impact": poverty_impact,
@@ -495,7 +495,8 @@ def upload_to_pr(chart_path: str, pr_number: int, metadata: dict, summary: dict
     )
 
     result = subprocess.run(
-        ["gh", "pr", "comment", str(pr_number), "--repo", repo, "--body", comment_body],
+        ["gh", "pr", "comment", str(pr_number), "--repo", repo, "--body-file", "-"],
+        input=comment_body,
         capture_output=True,
         text=True,
     )
@@ -30,12 +30,15 @@ An all-states scan uses ~11 requests (queries search all states by default).
 """
 
 import os
+import re
 import sys
 import json
 import hashlib
 import argparse
 import time
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime
 
 # ============== Configuration ==============
@@ -96,9 +99,52 @@ ABBR_TO_STATE = {v: k for k, v in STATE_ABBR.items()}
 # Target session year
 TARGET_SESSION_YEAR = 2026
 
+# Max processed_bills rows per batched upsert
+UPSERT_BATCH_SIZE = 500
+
 
 # ============== OpenStates API ==============
 
+# Shared HTTP session: keeps the TLS connection to OpenStates alive across
+# calls and retries connection errors/5xx responses. 429s are handled in
+# openstates_request, which needs the longer free-tier waits.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=1.0,
+        status_forcelist=[500, 502, 503, 504],
+        allowed_methods=["GET"],
+        raise_on_status=False,
+    ),
+))
+
+# (connect, read) timeout in seconds for OpenStates requests
+OPENSTATES_TIMEOUT = (5, 60)
+
+
+# Free tier: 10 requests/min, so request starts are spaced >= 6s apart
+MIN_REQUEST_INTERVAL = 6.0
+_last_request_at = 0.0
+
+
+def set_request_interval(seconds):
+    """Override MIN_REQUEST_INTERVAL (e.g. for API keys with a higher quota)."""
+    global MIN_REQUEST_INTERVAL
+    MIN_REQUEST_INTERVAL = seconds
+
+
+def _wait_for_rate_limit():
+    """Sleep only for what remains of MIN_REQUEST_INTERVAL since the last request."""
+    global _last_request_at
+    wait = _last_request_at + MIN_REQUEST_INTERVAL - time.monotonic()
+    if wait > 0:
+        time.sleep(wait)
+    _last_request_at = time.monotonic()
+
+
 def openstates_request(endpoint, params=None, max_retries=3):
     """Make a request to the OpenStates API v3 with retry on rate limit."""
     if not OPENSTATES_API_KEY:
@@ -108,7 +154,8 @@ def openstates_request(endpoint, params=None, max_retries=3):
     url = f"{OPENSTATES_BASE_URL}{endpoint}"
 
     for attempt in range(max_retries):
-        response = requests.get(url, headers=headers, params=params or {})
+        _wait_for_rate_limit()
+        response = _SESSION.get(url, headers=headers, params=params or {}, timeout=OPENSTATES_TIMEOUT)
 
         if response.status_code == 429:
             wait = 15 * (attempt + 1)  # 15s, 30s, 45s
@@ -120,7 +167,8 @@ def openstates_request(endpoint, params=None, max_retries=3):
         return response.json()
 
     # Final attempt without retry
-    response = requests.get(url, headers=headers, params=params or {})
+    _wait_for_rate_limit()
+    response = _SESSION.get(url, headers=headers, params=params or {}, timeout=OPENSTATES_TIMEOUT)
     response.raise_for_status()
     return response.json()
 
@@ -166,9 +214,6 @@ def search_bills_openstates(query, jurisdiction=None, session=None, per_page=20,
             if page >= total_pages:
                 break
 
-            # Free tier: 10 requests/min, so ~6s between requests
-            time.sleep(6)
-
         except Exception as e:
             print(f"  Warning: Search page {page} failed for '{query}': {e}")
             break
@@ -240,6 +285,17 @@ def normalize_bill(os_bill):
     }
 
 
+def _dedup_key(os_bill):
+    """
+    Dedup key (state:bill_number without spaces) for a raw OpenStates bill.
+
+    Matches the key built from normalize_bill's state and bill_number, so
+    bills can be deduplicated before being normalized.
+    """
+    state_abbr = STATE_ABBR.get(os_bill.get("jurisdiction", {}).get("name", ""), "")
+    return f"{state_abbr}:{os_bill.get('identifier', '').replace(' ', '')}"
+
+
 def _generate_bill_id(openstates_id):
     """
     Generate a stable integer from an OpenStates ID string.
@@ -255,6 +311,146 @@ def _generate_bill_id(openstates_id):
 
 # ============== Relevance Filter ==============
 
+# Keywords that indicate relevance (individual tax/benefits)
+RELEVANT_KEYWORDS = [
+    "personal income tax", "individual income tax",
+    "state income tax",
+    "income tax; reduce", "income tax; exclude",
+    "income tax rate", "tax bracket", "flat tax",
+    "standard deduction",
+    "eitc", "earned income tax credit", "earned income credit",
+    "child tax credit", "child and dependent care", "child and dependent care credit",
+    "personal exemption",
+    "working families tax credit", "working families credit",
+    "snap benefit", "food stamp",
+]
+
+# Keywords that indicate NOT relevant
+EXCLUDE_KEYWORDS = [
+    # Business/corporate
+    "business tax credit", "corporate", "tariff",
+    "enterprise zone", "investment tax credit",
+    "franchise tax", "commercial", "employer tax credit",
+    "industrial development", "business enterprises",
+    "opportunity zone", "economic development",
+    "thrift institution", "returnship", "phoenix employee",
+    "businesses that develop", "local employment",
+    "model management",
+    # Specific industry credits
+    "film tax credit", "film,", "postproduction",
+    "film and television", "television production",
+    "entertainment production",
+    "agricultural tax credit", "hemp", "timber",
+    "beginning farmer", "farmer tax credit", "carbon farming",
+    "farmers who use",
+    "clean energy", "energy production", "energy investment",
+    "aviation fuel", "hydroelectric", "motor fuel",
+    # Local/property taxes
+    "ad valorem", "county;", "city of",
+    "school district", "municipal",
+    "property tax", "school tax", "star credit", "the star",
+    # Developer/housing credits
+    "housing tax credit", "low income housing", "lihtc",
+    "at-risk development", "housing development fund",
+    "rent stabiliz", "maximum rent",
+    # Sales and use tax
+    "sales and use tax", "sales tax", "retail sales",
+    # Charitable/donation credits
+    "law enforcement", "contributions to", "foster child support",
+    "qualified education expense", "education expense tax credit",
+    "qualified education donation", "education donation",
+    "organ and tissue", "food rescue", "grocery donation",
+    "food donation",
+    # Government/authority
+    "authority act", "commission act", "redevelopment authority",
+    "governing authority",
+    # Military
+    "military", "active duty", "armed forces", "national guard",
+    # Health/employer
+    "health reimbursement arrangement", "employer health",
+    "warming center",
+    "medicaid", "teledentistry", "dentist", "dental",
+    "certificate of need", "rural hospital", "sickle cell",
+    "fertility", "peachcare",
+    "health insurance affordability", "aca", "marketplace",
+    # Education
+    "quality basic education", "educational opportunity",
+    "every student act", "school choice", "school voucher",
+    "education savings",
+    # Procedural/administrative
+    "levy and sale", "appeal and protest", "carryover", "carried forward",
+    "any bill proposing", "voting requirement",
+    "inheritance", "intestate succession",
+    # Other
+    "first responder", "volunteer tax credit",
+    "sports betting", "gaming",
+    "workforce-ready", "preceptor",
+    "firearm", "safe storage",
+    "historic", "rehabilitation of certified",
+    "emergency power", "generator",
+    "fire and emergency",
+    "rural development", "disclosure and posting",
+    # Disaster-specific
+    "wildfire", "wildland fire", "bobcat fire", "fire exclusion",
+    "landfill event", "disaster relief", "disaster exclusion",
+    # Trust taxation
+    "nongrantor trust", "grantor trust",
+    # Climate
+    "climate", "environmental conservation", "environmental",
+    # Real estate
+    "real property transfer", "transfer of real property",
+    "transfer of certain real prop",
+    # Not modeled
+    "minimum wage", "homebuyer", "home buyer", "homeowner",
+    "local income tax", "local tax collection",
+    "caregiver", "poll worker",
+    "work opportunity tax credit", "jobs development",
+    "lead poisoning", "lead free home",
+    "stock transfer", "gold star",
+    "child care capital", "child care program capital",
+    "opportunity account", "college preparation",
+    "child psychiatry", "real property transfer",
+    "irrigation", "utility bill",
+    "long-term health", "landowner",
+    "not-for-profit", "food service establishment",
+    "child support",
+    # Occupation-specific / behavior-specific
+    "psychiatry", "psychiatric", "mental health services",
+    "theft loss", "casualty loss",
+    "premarital counseling", "stillbirth",
+    # Niche credits/deductions
+    "conservation contribution", "conservation credit",
+    "long-term care insurance", "long-term care tax credit",
+    # Administrative/procedural
+    "check-off box", "surcharge",
+    "signage", "food distributor",
+    "emergency assistance", "incarcerated",
+    "adoption", "transitional tax credit",
+    "commissioner of", "department of social services",
+    "to study", "extends provisions", "extends the effectiveness",
+    "reissuance", "fraud victim",
+    "aggregate funds", "installment payment",
+    "foreign dependent",
+    "identifies and enrolls", "to be used to purchase",
+    "tax levy", "qualified expenses",
+    "awareness week", "providing for the study",
+    "gym membership", "fitness", "tithing",
+    "urge congress",
+    # Substances
+    "cannabis", "marijuana", "vapor product", "tobacco", "alcoholic beverages",
+]
+
+
+def _keyword_pattern(keywords):
+    """Compile keywords into one regex matching any of them as a substring."""
+    return re.compile("|".join(map(re.escape, keywords)))
+
+
+# One regex pass per bill instead of a substring scan per keyword
+_RELEVANT_PATTERN = _keyword_pattern(RELEVANT_KEYWORDS)
+_EXCLUDE_PATTERN = _keyword_pattern(EXCLUDE_KEYWORDS)
+
+
 def is_relevant_bill(bill):
     """
     Filter to determine if a bill is relevant to PolicyEngine.
@@ -272,139 +468,10 @@ def is_relevant_bill(bill):
 
     title = (title_field + " " + desc_field + " " + abstract_text).lower()
 
-    # Keywords that indicate relevance (individual tax/benefits)
-    relevant_keywords = [
-        "personal income tax", "individual income tax",
-        "state income tax",
-        "income tax; reduce", "income tax; exclude",
-        "income tax rate", "tax bracket", "flat tax",
-        "standard deduction",
-        "eitc", "earned income tax credit", "earned income credit",
-        "child tax credit", "child and dependent care", "child and dependent care credit",
-        "personal exemption",
-        "working families tax credit", "working families credit",
-        "snap benefit", "food stamp",
-    ]
-
-    # Keywords that indicate NOT relevant
-    exclude_keywords = [
-        # Business/corporate
-        "business tax credit", "corporate", "tariff",
-        "enterprise zone", "investment tax credit",
-        "franchise tax", "commercial", "employer tax credit",
-        "industrial development", "business enterprises",
-        "opportunity zone", "economic development",
-        "thrift institution", "returnship", "phoenix employee",
-        "businesses that develop", "local employment",
-        "model management",
-        # Specific industry credits
-        "film tax credit", "film,", "postproduction",
-        "film and television", "television production",
-        "entertainment production",
-        "agricultural tax credit", "hemp", "timber",
-        "beginning farmer", "farmer tax credit", "carbon farming",
-        "farmers who use",
-        "clean energy", "energy production", "energy investment",
-        "aviation fuel", "hydroelectric", "motor fuel",
-        # Local/property taxes
-        "ad valorem", "county;", "city of",
-        "school district", "municipal",
-        "property tax", "school tax", "star credit", "the star",
-        # Developer/housing credits
-        "housing tax credit", "low income housing", "lihtc",
-        "at-risk development", "housing development fund",
-        "rent stabiliz", "maximum rent",
-        # Sales and use tax
-        "sales and use tax", "sales tax", "retail sales",
-        # Charitable/donation credits
-        "law enforcement", "contributions to", "foster child support",
-        "qualified education expense", "education expense tax credit",
-        "qualified education donation", "education donation",
-        "organ and tissue", "food rescue", "grocery donation",
-        "food donation",
-        # Government/authority
-        "authority act", "commission act", "redevelopment authority",
-        "governing authority",
-        # Military
-        "military", "active duty", "armed forces", "national guard",
-        # Health/employer
-        "health reimbursement arrangement", "employer health",
-        "warming center",
-        "medicaid", "teledentistry", "dentist", "dental",
-        "certificate of need", "rural hospital", "sickle cell",
-        "fertility", "peachcare",
-        "health insurance affordability", "aca", "marketplace",
-        # Education
-        "quality basic education", "educational opportunity",
-        "every student act", "school choice", "school voucher",
-        "education savings",
-        # Procedural/administrative
-        "levy and sale", "appeal and protest", "carryover", "carried forward",
-        "any bill proposing", "voting requirement",
-        "inheritance", "intestate succession",
-        # Other
-        "first responder", "volunteer tax credit",
-        "sports betting", "gaming",
-        "workforce-ready", "preceptor",
-        "firearm", "safe storage",
-        "historic", "rehabilitation of certified",
-        "emergency power", "generator",
-        "fire and emergency",
-        "rural development", "disclosure and posting",
-        # Disaster-specific
-        "wildfire", "wildland fire", "bobcat fire", "fire exclusion",
-        "landfill event", "disaster relief", "disaster exclusion",
-        # Trust taxation
-        "nongrantor trust", "grantor trust",
-        # Climate
-        "climate", "environmental conservation", "environmental",
-        # Real estate
-        "real property transfer", "transfer of real property",
-        "transfer of certain real prop",
-        # Not modeled
-        "minimum wage", "homebuyer", "home buyer", "homeowner",
-        "local income tax", "local tax collection",
-        "caregiver", "poll worker",
-        "work opportunity tax credit", "jobs development",
-        "lead poisoning", "lead free home",
-        "stock transfer", "gold star",
-        "child care capital", "child care program capital",
-        "opportunity account", "college preparation",
-        "child psychiatry", "real property transfer",
-        "irrigation", "utility bill",
-        "long-term health", "landowner",
-        "not-for-profit", "food service establishment",
-        "child support",
-        # Occupation-specific / behavior-specific
-        "psychiatry", "psychiatric", "mental health services",
-        "theft loss", "casualty loss",
-        "premarital counseling", "stillbirth",
-        # Niche credits/deductions
-        "conservation contribution", "conservation credit",
-        "long-term care insurance", "long-term care tax credit",
-        # Administrative/procedural
-        "check-off box", "surcharge",
-        "signage", "food distributor",
-        "emergency assistance", "incarcerated",
-        "adoption", "transitional tax credit",
-        "commissioner of", "department of social services",
-        "to study", "extends provisions", "extends the effectiveness",
-        "reissuance", "fraud victim",
-        "aggregate funds", "installment payment",
-        "foreign dependent",
-        "identifies and enrolls", "to be used to purchase",
-        "tax levy", "qualified expenses",
-        "awareness week", "providing for the study",
-        "gym membership", "fitness", "tithing",
-        "urge congress",
-        # Substances
-        "cannabis", "marijuana", "vapor product", "tobacco", "alcoholic beverages",
-    ]
-
-    if any(kw in title for kw in exclude_keywords):
+    if _EXCLUDE_PATTERN.search(title):
         return False
 
-    return any(kw in title for kw in relevant_keywords)
+    return _RELEVANT_PATTERN.search(title) is not None
 
 
 # ============== Supabase Functions ==============
@@ -425,61 +492,104 @@ def get_supabase_client():
     return create_client(url, key)
 
 
-def get_processed_bill_keys(supabase):
+def get_processed_bill_keys(supabase, states=None):
     """
     Get set of already-processed bill dedup keys (state + bill_number).
 
     Using state+bill_number instead of bill_id since OpenStates IDs
     This prevents duplicates when re-running.
+
+    Pages by keyset on the unique bill_id column (bill_id > last seen),
+    so each page is an index range scan rather than an ever-growing OFFSET.
+    If states (abbreviations) is given, only those states' rows are fetched;
+    a scan limited to some states can only find bills from those states.
     """
     try:
         all_keys = set()
         page_size = 1000
-        offset = 0
+        last_bill_id = None
         while True:
-            result = (
+            query = (
                 supabase.table("processed_bills")
-                .select("state, bill_number")
-                .range(offset, offset + page_size - 1)
-                .execute()
+                .select("bill_id, state, bill_number")
+                .order("bill_id")
+                .limit(page_size)
             )
+            if states:
+                query = query.in_("state", [state.upper() for state in states])
+            if last_bill_id is not None:
+                query = query.gt("bill_id", last_bill_id)
+            result = query.execute()
             for r in result.data:
                 key = f"{r['state']}:{r['bill_number'].replace(' ', '')}"
                 all_keys.add(key)
             if len(result.data) < page_size:
                 break
-            offset += page_size
+            last_bill_id = result.data[-1]["bill_id"]
         return all_keys
     except Exception as e:
         print(f"Warning: Could not fetch processed bills: {e}")
         return set()
 
 
+def _processed_bill_row(bill_data, matched_query):
+    """Build a processed_bills row from a normalized bill.
+
+    Upserts of these rows use return=minimal: nothing reads the written rows
+    back, so PostgREST doesn't echo them and the client doesn't parse them.
+    """
+    return {
+        "bill_id": bill_data["bill_id"],
+        "state": bill_data["state"],
+        "bill_number": bill_data["bill_number"],
+        "title": bill_data["title"],
+        "description": bill_data["description"],
+        "status": bill_data["status"],
+        "status_date": bill_data["status_date"],
+        "last_action": bill_data["last_action"],
+        "last_action_date": bill_data["last_action_date"],
+        "official_url": bill_data["official_url"],
+        "session_name": bill_data.get("session_name", ""),
+        "legiscan_url": bill_data.get("legiscan_url", ""),
+        "matched_query": matched_query,
+    }
+
+
 def save_processed_bill(supabase, bill_data, matched_query):
     """Save a normalized bill to Supabase processed_bills table."""
     try:
-        data = {
-            "bill_id": bill_data["bill_id"],
-            "state": bill_data["state"],
-            "bill_number": bill_data["bill_number"],
-            "title": bill_data["title"],
-            "description": bill_data["description"],
-            "status": bill_data["status"],
-            "status_date": bill_data["status_date"],
-            "last_action": bill_data["last_action"],
-            "last_action_date": bill_data["last_action_date"],
-            "official_url": bill_data["official_url"],
-            "session_name": bill_data.get("session_name", ""),
-            "legiscan_url": bill_data.get("legiscan_url", ""),
-            "matched_query": matched_query,
-        }
-        supabase.table("processed_bills").upsert(data).execute()
+        supabase.table("processed_bills").upsert(
+            _processed_bill_row(bill_data, matched_query), returning="minimal",
+        ).execute()
         return True
     except Exception as e:
         print(f"  Warning: Could not save to Supabase: {e}")
         return False
 
 
+def save_processed_bills(supabase, bills):
+    """
+    Save (normalized_bill, matched_query) pairs in batched upserts.
+
+    A failed batch is retried one bill at a time so a single bad row
+    doesn't drop the rest. Returns the number of bills saved.
+    """
+    saved = 0
+    for start in range(0, len(bills), UPSERT_BATCH_SIZE):
+        batch = bills[start:start + UPSERT_BATCH_SIZE]
+        try:
+            rows = [_processed_bill_row(bill_data, matched_query) for bill_data, matched_query in batch]
+            supabase.table("processed_bills").upsert(rows, returning="minimal").execute()
+            saved += len(batch)
+        except Exception as e:
+            print(f"  Warning: Batch save failed ({e}); saving {len(batch)} bills individually")
+            saved += sum(
+                save_processed_bill(supabase, bill_data, matched_query)
+                for bill_data, matched_query in batch
+            )
+    return saved
+
+
 # ============== Scan Modes ==============
 
 def run_search_scan(supabase, states, queries, dry_run):
@@ -488,63 +598,49 @@ def run_search_scan(supabase, states, queries, dry_run):
 
     Returns (new_bills, stats).
     """
-    processed_keys = get_processed_bill_keys(supabase)
+    processed_keys = get_processed_bill_keys(supabase, states)
     print(f"Previously processed: {len(processed_keys)} bills")
     print()
 
     skipped_processed = 0
     skipped_irrelevant = 0
-    candidate_bills = {}  # dedup_key -> (normalized_bill, matched_query)
+    candidate_bills = {}  # dedup_key -> (raw OpenStates bill, matched_query)
+
+    def collect(results, query):
+        """Filter raw search results down to new relevant bills."""
+        nonlocal skipped_processed, skipped_irrelevant
+        for os_bill in results:
+            dedup_key = _dedup_key(os_bill)
+
+            if dedup_key in processed_keys:
+                skipped_processed += 1
+                continue
+
+            # A bill already collected by an earlier query is known relevant
+            if dedup_key not in candidate_bills and not is_relevant_bill(os_bill):
+                skipped_irrelevant += 1
+                continue
 
-    for qi, query in enumerate(queries):
+            candidate_bills[dedup_key] = (os_bill, query)
+
+    for query in queries:
         print(f"Searching: '{query}'")
 
         if states:
-            for si, state_abbr in enumerate(states):
+            for state_abbr in states:
                 jurisdiction = ABBR_TO_STATE.get(state_abbr, state_abbr)
                 results = search_bills_openstates(query, jurisdiction=jurisdiction)
                 print(f"  {state_abbr}: {len(results)} results")
 
-                for os_bill in results:
-                    normalized = normalize_bill(os_bill)
-                    dedup_key = f"{normalized['state']}:{normalized['bill_number'].replace(' ', '')}"
-
-                    if dedup_key in processed_keys:
-                        skipped_processed += 1
-                        continue
-
-                    if not is_relevant_bill(os_bill):
-                        skipped_irrelevant += 1
-                        continue
-
-                    candidate_bills[dedup_key] = (normalized, query)
-
-                # Delay between states within a query
-                if si < len(states) - 1:
-                    time.sleep(6)
+                collect(results, query)
         else:
             results = search_bills_openstates(query)
             print(f"  All states: {len(results)} results")
 
-            for os_bill in results:
-                normalized = normalize_bill(os_bill)
-                dedup_key = f"{normalized['state']}:{normalized['bill_number'].replace(' ', '')}"
-
-                if dedup_key in processed_keys:
-                    skipped_processed += 1
-                    continue
-
-                if not is_relevant_bill(os_bill):
-                    skipped_irrelevant += 1
-                    continue
+            collect(results, query)
 
-                candidate_bills[dedup_key] = (normalized, query)
-
-        # Delay between queries (free tier: 10 req/min)
-        if qi < len(queries) - 1:
-            time.sleep(6)
-
-    new_bills = list(candidate_bills.values())
+    # Normalize once per unique bill, after all queries have been merged
+    new_bills = [(normalize_bill(os_bill), query) for os_bill, query in candidate_bills.values()]
     stats = {
         "skipped_processed": skipped_processed,
         "skipped_irrelevant": skipped_irrelevant,
@@ -559,7 +655,13 @@ def main():
     parser.add_argument("--states", help="Comma-separated state codes (e.g., NY,GA,CT)")
     parser.add_argument("--dry-run", action="store_true", help="Show what would be saved without writing")
     parser.add_argument("--query", help="Run a single ad-hoc search query")
+    parser.add_argument("--verbose", action="store_true", help="List each new bill even when output isn't a terminal")
+    parser.add_argument(
+        "--request-interval", type=float, default=MIN_REQUEST_INTERVAL,
+        help=f"Minimum seconds between OpenStates requests (default: {MIN_REQUEST_INTERVAL:g}, free tier)",
+    )
     args = parser.parse_args()
+    set_request_interval(args.request_interval)
 
     if not OPENSTATES_API_KEY:
         print("Error: OPENSTATES_API_KEY environment variable not set")
@@ -598,15 +700,14 @@ def main():
         print("No new bills to process.")
         return 0
 
-    # Show bills
-    print("Bills to include:")
-    for bill_data, matched_query in new_bills:
-        state = bill_data["state"]
-        bill_num = bill_data["bill_number"]
-        title = bill_data["title"][:60]
-        url = bill_data["official_url"]
-        print(f"  [{state} {bill_num}] {title}...")
-        print(f"    {url}")
+    # Show bills (built up front and written once). Skipped in scheduled
+    # runs, where nobody reads the per-bill listing, unless --verbose.
+    if args.verbose or args.dry_run or sys.stdout.isatty():
+        lines = ["Bills to include:"]
+        for bill_data, matched_query in new_bills:
+            lines.append(f"  [{bill_data['state']} {bill_data['bill_number']}] {bill_data['title'][:60]}...")
+            lines.append(f"    {bill_data['official_url']}")
+        print("\n".join(lines))
 
     if args.dry_run:
         print()
@@ -614,10 +715,7 @@ def main():
         return 0
 
     # Save to Supabase
-    saved = 0
-    for bill_data, matched_query in new_bills:
-        if save_processed_bill(supabase, bill_data, matched_query):
-            saved += 1
+    saved = save_processed_bills(supabase, new_bills)
 
     print()
     print(f"Done! Saved {saved} new bills to Supabase.")
@@ -30,6 +30,8 @@ import json
 import argparse
 import time
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # ============== Configuration ==============
 
@@ -91,6 +93,46 @@ STAGE_LABELS = {
 }
 
 
+# Shared HTTP session: keeps the TLS connection to OpenStates alive across
+# calls and retries connection errors/5xx responses. 429s are handled in
+# openstates_request, which needs the longer free-tier waits.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=1.0,
+        status_forcelist=[500, 502, 503, 504],
+        allowed_methods=["GET"],
+        raise_on_status=False,
+    ),
+))
+
+# (connect, read) timeout in seconds for OpenStates requests
+OPENSTATES_TIMEOUT = (5, 60)
+
+
+# Free tier: 10 requests/min; 7s spacing leaves headroom for retries
+MIN_REQUEST_INTERVAL = 7.0
+_last_request_at = 0.0
+
+
+def set_request_interval(seconds):
+    """Override MIN_REQUEST_INTERVAL (e.g. for API keys with a higher quota)."""
+    global MIN_REQUEST_INTERVAL
+    MIN_REQUEST_INTERVAL = seconds
+
+
+def _wait_for_rate_limit():
+    """Sleep only for what remains of MIN_REQUEST_INTERVAL since the last request."""
+    global _last_request_at
+    wait = _last_request_at + MIN_REQUEST_INTERVAL - time.monotonic()
+    if wait > 0:
+        time.sleep(wait)
+    _last_request_at = time.monotonic()
+
+
 def openstates_request(endpoint, params=None, max_retries=3):
     """Make a request to the OpenStates API v3 with retry on rate limit."""
     if not OPENSTATES_API_KEY:
@@ -100,7 +142,8 @@ def openstates_request(endpoint, params=None, max_retries=3):
     url = f"{OPENSTATES_BASE_URL}{endpoint}"
 
     for attempt in range(max_retries):
-        response = requests.get(url, headers=headers, params=params or {})
+        _wait_for_rate_limit()
+        response = _SESSION.get(url, headers=headers, params=params or {}, timeout=OPENSTATES_TIMEOUT)
 
         if response.status_code == 429:
             wait = 15 * (attempt + 1)
@@ -114,7 +157,8 @@ def openstates_request(endpoint, params=None, max_retries=3):
         response.raise_for_status()
         return response.json()
 
-    response = requests.get(url, headers=headers, params=params or {})
+    _wait_for_rate_limit()
+    response = _SESSION.get(url, headers=headers, params=params or {}, timeout=OPENSTATES_TIMEOUT)
     if response.status_code == 429:
         print(f"  Still rate limited after {max_retries} retries, skipping")
         return None
@@ -220,7 +264,12 @@ def main():
     parser.add_argument("--dry-run", action="store_true", help="Show changes without writing")
     parser.add_argument("--all", action="store_true", help="Include all bills, not just scored ones")
     parser.add_argument("--offset", type=int, default=0, help="Skip first N bills (resume from where you left off)")
+    parser.add_argument(
+        "--request-interval", type=float, default=MIN_REQUEST_INTERVAL,
+        help=f"Minimum seconds between OpenStates requests (default: {MIN_REQUEST_INTERVAL:g}, free tier)",
+    )
     args = parser.parse_args()
+    set_request_interval(args.request_interval)
 
     if not OPENSTATES_API_KEY:
         print("Error: OPENSTATES_API_KEY environment variable not set")
@@ -323,10 +372,6 @@ def main():
             print(f"ERROR: {e}")
             errors += 1
 
-        # Rate limiting: 10 req/min on free tier
-        if i < len(bills) - 1:
-            time.sleep(7)
-
     print()
     print(f"Done!")
     print(f"  Updated: {updated}")